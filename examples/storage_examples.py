@@ -23,17 +23,16 @@ async def example_local_storage():
     # Default configuration - saves to data/raw/YYYY_MM_DD/
     config = StorageConfig()
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 async def example_s3_with_credentials_file():
@@ -51,17 +50,16 @@ async def example_s3_with_credentials_file():
         enable_fallback=True  # Falls back to local if S3 fails
     )
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 async def example_s3_with_explicit_credentials():
@@ -81,17 +79,16 @@ async def example_s3_with_explicit_credentials():
         enable_fallback=False  # Raise error if S3 fails
     )
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 async def example_gcs_with_credentials_file():
@@ -109,17 +106,16 @@ async def example_gcs_with_credentials_file():
         enable_fallback=True
     )
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 async def example_gcs_with_env_credentials():
@@ -138,17 +134,16 @@ async def example_gcs_with_env_credentials():
         enable_fallback=True
     )
 
-    scraper = WebsiteScraper(storage_config=config)
-
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 async def example_s3_without_fallback():
@@ -165,21 +160,20 @@ async def example_s3_without_fallback():
         enable_fallback=False  # Strict mode - fail if cloud storage fails
     )
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    try:
-        result = await scraper.scrape_website(request)
-        print(f"Data saved to: {result}")
-    except Exception as e:
-        print(f"Error: {e}")
-        print("Note: enable_fallback=False means errors are not caught")
-    print()
+        try:
+            result = await scraper.scrape_website(request)
+            print(f"Data saved to: {result}")
+        except Exception as e:
+            print(f"Error: {e}")
+            print("Note: enable_fallback=False means errors are not caught")
+        print()
 
 
 async def example_scrape_multiple_with_s3():
@@ -196,23 +190,22 @@ async def example_scrape_multiple_with_s3():
         enable_fallback=True
     )
 
-    scraper = WebsiteScraper(
+    async with WebsiteScraper(
         storage_config=config,
         max_concurrent=3,  # Scrape 3 sites concurrently
         requests_per_second=2.0  # Rate limit: 2 requests/second
-    )
+    ) as scraper:
+        urls = [
+            "https://example.com",
+            "https://example.org",
+            "https://example.net"
+        ]
 
-    urls = [
-        "https://example.com",
-        "https://example.org",
-        "https://example.net"
-    ]
+        results = await scraper.scrape_multiple_urls(urls)
 
-    results = await scraper.scrape_multiple_urls(urls)
-
-    for url, result_path in results.items():
-        print(f"{url} -> {result_path}")
-    print()
+        for url, result_path in results.items():
+            print(f"{url} -> {result_path}")
+        print()
 
 
 async def example_custom_path_structure():
@@ -228,17 +221,16 @@ async def example_custom_path_structure():
         partition_by_date=False  # No date-based subdirectories
     )
 
-    scraper = WebsiteScraper(storage_config=config)
+    async with WebsiteScraper(storage_config=config) as scraper:
+        request = ScrapingRequest(
+            url="https://example.com",
+            website_id="example",
+            max_pages=1
+        )
 
-    request = ScrapingRequest(
-        url="https://example.com",
-        website_id="example",
-        max_pages=1
-    )
-
-    result = await scraper.scrape_website(request)
-    print(f"Data saved to: {result}")
-    print()
+        result = await scraper.scrape_website(request)
+        print(f"Data saved to: {result}")
+        print()
 
 
 # Main function to run all examples
@@ -4,6 +4,7 @@ Simple test that scrapes a website and checks for keywords.
 This demonstrates the core functionality of the scraper.
 """
 import asyncio
+import re
 import sys
 from pathlib import Path
 
@@ -12,6 +13,32 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from scraper import WebsiteScraper, BrowserConfig, StorageConfig
 
+TEST_URL = "https://httpbin.org/html"
+EXPECTED_KEYWORDS = ("html", "body", "httpbin")
+
+
+# Lookahead so overlapping keywords starting at the same offset all match
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, EXPECTED_KEYWORDS)) + "))", re.IGNORECASE
+)
+
+
+def find_keywords(texts):
+    """Return the expected keywords that occur (case-insensitively) in any of the texts.
+
+    All keywords are matched in a single pass over each text instead of one
+    substring scan per keyword, and the texts are never joined into one copy.
+    Empty texts are skipped, the shortest texts are scanned first and scanning
+    stops once every keyword was seen, so the raw HTML is often never touched.
+    """
+    found = set()
+    for text in sorted(filter(None, texts), key=len):
+        for match in _KEYWORD_RE.finditer(text):
+            found.add(match.group(1).lower())
+            if len(found) == len(EXPECTED_KEYWORDS):
+                return found
+    return found
+
 async def test_keyword_scraping():
     """Test scraping a website and checking for specific keywords."""
     
@@ -32,15 +59,18 @@ async def test_keyword_scraping():
     )
     
     # Test URL and expected keywords
-    test_url = "https://httpbin.org/html"
-    expected_keywords = ["html", "body", "httpbin"]
+    test_url = TEST_URL
+    expected_keywords = list(EXPECTED_KEYWORDS)
     
     print(f"🌐 Scraping URL: {test_url}")
     print(f"🎯 Looking for keywords: {expected_keywords}")
     print()
     
     # Scrape the page
-    result = await scraper.scrape_single_url(test_url, browser_config)
+    try:
+        result = await scraper.scrape_single_url(test_url, browser_config)
+    finally:
+        await scraper.aclose()
     
     # Display basic results
     print("📊 Scraping Results:")
@@ -71,24 +101,19 @@ async def test_keyword_scraping():
     
     # Check for keywords
     print("🔍 Keyword Analysis:")
-    # Include all text fields in keyword search
-    all_text_content = [result.html, result.text]
-    if result.text_clean:
-        all_text_content.append(result.text_clean)
-    if result.text_markdown:
-        all_text_content.append(result.text_markdown)
-    content = " ".join(all_text_content).lower()
-    
-    found_keywords = []
-    missing_keywords = []
-    
-    for keyword in expected_keywords:
-        if keyword.lower() in content:
-            found_keywords.append(keyword)
-            print(f"   ✅ Found: '{keyword}'")
-        else:
-            missing_keywords.append(keyword)
-            print(f"   ❌ Missing: '{keyword}'")
+    # Include all text fields in keyword search (missing formats are skipped)
+    present = find_keywords(
+        [result.html, result.text, result.text_clean, result.text_markdown]
+    )
+    
+    found_keywords = [keyword for keyword in expected_keywords if keyword in present]
+    missing_keywords = [keyword for keyword in expected_keywords if keyword not in present]
+    
+    # One write for the whole report instead of one print per keyword
+    print("\n".join(
+        f"   ✅ Found: '{keyword}'" if keyword in present else f"   ❌ Missing: '{keyword}'"
+        for keyword in expected_keywords
+    ))
     
     print()
     print(f"📈 Results Summary:")
@@ -1,9 +1,100 @@
 """Data models for German municipal scraping system."""
 
-from datetime import datetime, timezone
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, HttpUrl
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, TypeVar
+from pydantic import (
+    AfterValidator, BaseModel, BeforeValidator, Field, HttpUrl, TypeAdapter, ValidationInfo
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Timestamp shared by every model built inside a frozen_now() block.
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar("_frozen_now", default=None)
+
+
+def _utcnow() -> datetime:
+    """Default factory for timestamp fields; honours frozen_now()."""
+    return _frozen_now.get() or datetime.now(timezone.utc)
+
+
+def _utcnow_us() -> int:
+    """Default factory for unix-microsecond timestamp fields."""
+    frozen = _frozen_now.get()
+    if frozen is not None:
+        return to_unix_us(frozen)
+    return time.time_ns() // 1_000
+
+
+def to_unix_us(value: datetime) -> int:
+    """Convert a datetime (naive means UTC) to unix microseconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_unix_us(value: int) -> datetime:
+    """Convert unix microseconds to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _coerce_unix_us(value: Any) -> Any:
+    return to_unix_us(value) if isinstance(value, datetime) else value
+
+
+# int64 unix microseconds; also accepts datetimes. Smaller per row than a
+# datetime and maps directly onto Arrow's timestamp('us') storage.
+UnixMicros = Annotated[int, BeforeValidator(_coerce_unix_us)]
+
+
+class _TimestampViews:
+    """Datetime views over the unix-microsecond created_at/updated_at fields."""
+
+    @property
+    def created_at_dt(self) -> datetime:
+        return from_unix_us(self.created_at)
+
+    @property
+    def updated_at_dt(self) -> datetime:
+        return from_unix_us(self.updated_at)
+
+
+@contextmanager
+def frozen_now(ts: Optional[datetime] = None) -> Iterator[datetime]:
+    """Stamp all models created in this block with a single timestamp.
+
+    Collapses the two clock reads per row down to one per batch.
+    """
+    ts = ts or datetime.now(timezone.utc)
+    token = _frozen_now.set(ts)
+    try:
+        yield ts
+    finally:
+        _frozen_now.reset(token)
+
+
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def _check_url(value: str, info: ValidationInfo) -> str:
+    """Re-check a URL with HttpUrl when the validation context asks for it.
+
+    URLs are usually validated upstream, so the check is opt-in per call:
+    ``Model.model_validate(data, context={"validate_urls": True})``.
+    """
+    if info.context and info.context.get("validate_urls"):
+        return str(_HTTP_URL.validate_python(value))
+    return value
+
+
+# A URL kept as a plain str; see _check_url for the opt-in HttpUrl check
+CheckedUrl = Annotated[str, AfterValidator(_check_url)]
 
 
 class GermanState(str, Enum):
@@ -82,9 +173,10 @@ class ScrapingStatus(str, Enum):
     SCRAPED = "scraped"
     FAILED = "failed"
     BLOCKED = "blocked"
+    SKIPPED = "skipped"
 
 
-class Municipality(BaseModel):
+class Municipality(_TimestampViews, BaseModel):
     """German municipality data model."""
     name: str
     official_name: Optional[str] = None
@@ -96,19 +188,19 @@ class Municipality(BaseModel):
     area_km2: Optional[float] = None
     
     # RIS System Information
-    ris_url: Optional[HttpUrl] = None
+    ris_url: Optional[CheckedUrl] = None
     ris_provider: RISProvider = RISProvider.UNKNOWN
     ris_accessible: bool = False
     last_discovery_check: Optional[datetime] = None
     discovery_status: ScrapingStatus = ScrapingStatus.PENDING
     
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: UnixMicros = Field(default_factory=_utcnow_us)
+    updated_at: UnixMicros = Field(default_factory=_utcnow_us)
     scraping_notes: Optional[str] = None
 
 
-class Meeting(BaseModel):
+class Meeting(_TimestampViews, BaseModel):
     """Municipal meeting data model."""
     municipality_name: str
     meeting_id: Optional[str] = None  # System-specific meeting ID
@@ -126,7 +218,7 @@ class Meeting(BaseModel):
     status: str = "scheduled"  # scheduled, completed, cancelled
     
     # System Information
-    source_url: Optional[HttpUrl] = None
+    source_url: Optional[CheckedUrl] = None
     ris_provider: RISProvider = RISProvider.UNKNOWN
     
     # Scraping Status
@@ -134,11 +226,11 @@ class Meeting(BaseModel):
     last_scraped: Optional[datetime] = None
     
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: UnixMicros = Field(default_factory=_utcnow_us)
+    updated_at: UnixMicros = Field(default_factory=_utcnow_us)
 
 
-class MeetingDocument(BaseModel):
+class MeetingDocument(_TimestampViews, BaseModel):
     """Document associated with a meeting."""
     municipality_name: str
     meeting_id: Optional[str] = None
@@ -151,7 +243,7 @@ class MeetingDocument(BaseModel):
     file_format: Optional[str] = None  # pdf, doc, docx, etc.
     
     # Access Information
-    download_url: Optional[HttpUrl] = None
+    download_url: Optional[CheckedUrl] = None
     direct_access: bool = False
     requires_session: bool = False
     
@@ -167,13 +259,15 @@ class MeetingDocument(BaseModel):
     # Status
     download_status: ScrapingStatus = ScrapingStatus.PENDING
     last_downloaded: Optional[datetime] = None
+    etag: Optional[str] = None  # HTTP validators for conditional re-downloads
+    last_modified: Optional[str] = None
     
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: UnixMicros = Field(default_factory=_utcnow_us)
+    updated_at: UnixMicros = Field(default_factory=_utcnow_us)
 
 
-class Protocol(BaseModel):
+class Protocol(_TimestampViews, BaseModel):
     """Meeting protocol with extracted content."""
     municipality_name: str
     meeting_id: Optional[str] = None
@@ -183,14 +277,15 @@ class Protocol(BaseModel):
     title: str
     meeting_date: datetime
     meeting_type: MeetingType
-    attendees: List[str] = Field(default_factory=list)
-    topics: List[str] = Field(default_factory=list)
-    decisions: List[str] = Field(default_factory=list)
+    # Read-only after construction: default to a shared empty tuple
+    attendees: Sequence[str] = ()
+    topics: Sequence[str] = ()
+    decisions: Sequence[str] = ()
     
     # Content
     full_text: str
     summary: Optional[str] = None
-    key_points: List[str] = Field(default_factory=list)
+    key_points: Sequence[str] = ()
     
     # Source Document
     source_document: Optional[MeetingDocument] = None
@@ -201,19 +296,19 @@ class Protocol(BaseModel):
     processing_notes: Optional[str] = None
     
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: UnixMicros = Field(default_factory=_utcnow_us)
+    updated_at: UnixMicros = Field(default_factory=_utcnow_us)
 
 
 class DiscoveryResult(BaseModel):
     """Result of municipality RIS discovery."""
     municipality: Municipality
-    discovered_urls: List[HttpUrl] = Field(default_factory=list)
-    verified_url: Optional[HttpUrl] = None
+    discovered_urls: List[CheckedUrl] = Field(default_factory=list)
+    verified_url: Optional[CheckedUrl] = None
     provider_detected: RISProvider = RISProvider.UNKNOWN
     accessibility_test_passed: bool = False
     discovery_method: str = "unknown"
-    discovery_timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    discovery_timestamp: datetime = Field(default_factory=_utcnow)
     error_messages: List[str] = Field(default_factory=list)
 
 
@@ -221,7 +316,7 @@ class ScrapingSession(BaseModel):
     """Scraping session tracking."""
     session_id: str
     municipality_name: str
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
     
     # Statistics
@@ -232,11 +327,35 @@ class ScrapingSession(BaseModel):
     errors_encountered: int = 0
     
     # Results
-    meetings: List[Meeting] = Field(default_factory=list)
-    documents: List[MeetingDocument] = Field(default_factory=list)
-    protocols: List[Protocol] = Field(default_factory=list)
+    # Assigned wholesale by the scraper, never appended to
+    meetings: Sequence[Meeting] = ()
+    documents: Sequence[MeetingDocument] = ()
+    protocols: Sequence[Protocol] = ()
     
     # Status
     status: ScrapingStatus = ScrapingStatus.PENDING
     error_log: List[str] = Field(default_factory=list)
-    notes: Optional[str] = None
\ No newline at end of file
+    notes: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per model) a TypeAdapter validating a list of that model."""
+    return TypeAdapter(List[model])
+
+
+def validate_many(
+    model: Type[ModelT],
+    rows: Iterable[Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None
+) -> List[ModelT]:
+    """Validate a batch of raw rows into model instances.
+
+    The whole batch is handed to pydantic-core in a single call instead of
+    running one Python-level ``__init__`` per row, which matters when a
+    page yields hundreds of meetings or documents. All rows in the batch
+    share one ``created_at``/``updated_at`` timestamp. ``context`` is the
+    validation context, e.g. ``{"validate_urls": True}``.
+    """
+    with frozen_now():
+        return _list_adapter(model).validate_python(list(rows), context=context)
@@ -1,29 +1,125 @@
 """Protocol scraper for extracting meeting documents from German municipal RIS systems."""
 
 import asyncio
+import hashlib
+import json
 import logging
+import multiprocessing
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Tuple, Set
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Optional, Sequence, Tuple, Set, TypeVar, Union
 from urllib.parse import urljoin, urlparse
 import aiohttp
-import aiofiles
 from pathlib import Path
 import os
+import tempfile
+import trafilatura
 
 from ..scraper import WebsiteScraper, BrowserConfig, ScrapedContent
 from .data_models import (
     Municipality, Meeting, MeetingDocument, Protocol, ScrapingSession,
-    MeetingType, DocumentType, RISProvider, ScrapingStatus
+    MeetingType, DocumentType, RISProvider, ScrapingStatus, validate_many
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 # Default scraping configuration constants
 DEFAULT_MAX_CONCURRENT = 2  # Be respectful to municipal servers
 DEFAULT_REQUESTS_PER_SECOND = 0.5  # Conservative rate limiting
 DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB default download limit
+DEFAULT_MAX_DOWNLOADS = 16  # Concurrent document downloads across all hosts
+DEFAULT_CONNECTION_LIMIT = 64  # Total pooled HTTP connections
+DEFAULT_CONNECTIONS_PER_HOST = 4  # Pooled connections per municipal server
+DEFAULT_PAGE_CACHE_SIZE = 500  # Rendered pages kept for re-use within a run
+DOWNLOAD_FLUSH_SIZE = 1024 * 1024  # Write downloads to disk in >=1 MiB slices
+DOWNLOAD_READ_BUFSIZE = 128 * 1024  # aiohttp per-response read buffer
+VALIDATOR_SIDECAR = '.etags.json'  # Per-municipality ETag/Last-Modified store
+
+# Content types of web pages rather than documents: a document link that
+# answers with one of these leads to an error, login or overview page.
+# Anything else is downloaded, since RIS servers label PDFs and Word files
+# loosely (application/x-pdf, application/force-download, ...).
+PAGE_CONTENT_TYPES = frozenset({
+    'text/html',
+    'application/xhtml+xml',
+})
+
+# Numeric date formats, compiled once: DD.MM.YYYY and YYYY-MM-DD
+_DATE_DDMMYYYY = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_DATE_ISO = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+
+def _write_all(fd: int, data: bytearray) -> None:
+    """Write all of data to fd, handling short writes without copying."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _read_validators(path: Path) -> Dict[str, Dict[str, str]]:
+    """Load a validator sidecar, treating a missing or corrupt file as empty."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_validators(path: Path, validators: Dict[str, Dict[str, str]]) -> None:
+    """Atomically replace a validator sidecar."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(validators, f)
+    os.replace(tmp_path, path)
+
+
+def _read_text_document(path: str) -> str:
+    """Read a downloaded plain text document."""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def _extract_html_text(path: str) -> Optional[str]:
+    """Extract the main text of a downloaded HTML document.
+
+    Module-level so it can run on a process pool.
+    """
+    with open(path, 'rb') as f:
+        return trafilatura.extract(f.read(), output_format='txt')
+
+
+@dataclass(slots=True)
+class _DocLinkInfo:
+    """A document link found on a meeting page."""
+    url: str
+    title: str
+    document_type: DocumentType
+    file_format: Optional[str]
+    file_name: str
+
+
+def _keyword_regex(keywords) -> re.Pattern:
+    """Compile keywords into one case-insensitive alternation.
+
+    Each keyword becomes a named group, so ``match.lastgroup`` maps a hit
+    straight back to its keyword without lowering the input first. The
+    leftmost match wins; keywords are tried longest-first so that, at the
+    same position, the most specific keyword is chosen.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile(
+        '|'.join(f'(?P<{keyword}>{re.escape(keyword)})' for keyword in ordered),
+        re.IGNORECASE
+    )
 
 
 class ProtocolScraper:
@@ -53,8 +149,26 @@ class ProtocolScraper:
         'anlage': DocumentType.ANLAGE
     }
     
+    # Keywords marking a link as meeting-related on generic systems
+    MEETING_LINK_KEYWORDS = [
+        'sitzung', 'meeting', 'protokoll', 'tagesordnung',
+        'gemeinderat', 'stadtrat', 'ausschuss'
+    ]
+
+    # Link patterns used by regisafe for meeting/agenda pages
+    REGISAFE_LINK_PATTERNS = ('si010', 'to010', 'session')
+    REGISAFE_LINK_RE = re.compile('|'.join(REGISAFE_LINK_PATTERNS), re.IGNORECASE)
+
+    # Single-pass classifiers; the earliest keyword in the text wins
+    MEETING_TYPE_RE = _keyword_regex(MEETING_TYPE_MAPPING)
+    DOCUMENT_TYPE_RE = _keyword_regex(DOCUMENT_TYPE_MAPPING)
+    MEETING_LINK_RE = _keyword_regex(MEETING_LINK_KEYWORDS)
+    
     # Common file extensions for meeting documents
     DOCUMENT_EXTENSIONS = ['.pdf', '.doc', '.docx', '.txt', '.html']
+    DOCUMENT_EXTENSION_SET = frozenset(DOCUMENT_EXTENSIONS)
+    # Extension at the end of the URL, optionally followed by a query/fragment
+    DOCUMENT_LINK_RE = re.compile(r'\.(?:pdf|docx?|txt|html)(?:$|[?#])', re.IGNORECASE)
     
     def __init__(
         self,
@@ -67,12 +181,39 @@ class ProtocolScraper:
             max_concurrent=max_concurrent,
             requests_per_second=requests_per_second
         )
+        # A scraper created here is ours to close; a passed-in one is not
+        self._owns_scraper = scraper is None
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._download_semaphore = asyncio.Semaphore(DEFAULT_MAX_DOWNLOADS)
+
+        # LRU of rendered pages: meeting pages are otherwise rendered once for
+        # details and again for document links
+        self._page_cache: "OrderedDict[str, ScrapedContent]" = OrderedDict()
+        self._page_locks: Dict[str, asyncio.Lock] = {}
+        self.page_cache_size = DEFAULT_PAGE_CACHE_SIZE
+        # Per-page link classification, keyed by page URL
+        self._link_index_cache: "OrderedDict[str, Tuple[List[str], Dict[str, List[str]]]]" = OrderedDict()
+        # HTTP validators (ETag/Last-Modified) by download URL, per municipality dir
+        self._validators: Dict[Path, Dict[str, Dict[str, str]]] = {}
+        # Directories already created by _ensure_dir
+        self._ensured_dirs: Set[Path] = set()
+        self._ensure_dir_lock = asyncio.Lock()
+        # HTML text extraction is CPU-bound; started on first HTML document
+        self._html_pool: Optional[ProcessPoolExecutor] = None
         
     async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=DEFAULT_CONNECTION_LIMIT,
+            limit_per_host=DEFAULT_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
+            read_bufsize=DOWNLOAD_READ_BUFSIZE,
             timeout=aiohttp.ClientTimeout(total=60),
             headers={'User-Agent': 'Mozilla/5.0 (compatible; MunicipalProtocolScraper/1.0)'}
         )
@@ -81,6 +222,38 @@ class ProtocolScraper:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        if self._html_pool is not None:
+            pool, self._html_pool = self._html_pool, None
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        if self._owns_scraper:
+            await self.scraper.aclose()
+
+    def _get_html_pool(self) -> ProcessPoolExecutor:
+        """Return the HTML text extraction pool, starting it if needed."""
+        if self._html_pool is None:
+            # spawn: forking a process that hosts Playwright's threads is unsafe
+            self._html_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._html_pool
+
+    async def _extract_document_text(self, path: str) -> Optional[str]:
+        """Extract the text of a downloaded document, or None if unsupported.
+
+        Only HTML goes to the process pool; the extension is checked here
+        first so unsupported formats never start or wait on it.
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.txt':
+            return await asyncio.to_thread(_read_text_document, path)
+        if ext == '.html':
+            # Step 4 runs these concurrently, spreading pages across cores
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_html_pool(), _extract_html_text, path
+            )
+        # PDF and Word extraction is not implemented yet
+        return None
             
     async def scrape_municipality_protocols(
         self,
@@ -108,45 +281,61 @@ class ProtocolScraper:
             session.meetings_found = len(meetings)
             
             # Step 2: Extract documents from meetings
+            # Errors and results are collected in locals and written to the
+            # session once per step
+            errors: List[str] = []
             all_documents = []
-            for meeting in meetings:
-                try:
-                    documents = await self._extract_meeting_documents(meeting, municipality)
-                    all_documents.extend(documents)
-                except Exception as e:
-                    error_msg = f"Failed to extract documents for meeting {meeting.title}: {e}"
-                    session.error_log.append(error_msg)
-                    logger.warning(error_msg)
+            results = await self._run_bounded(
+                lambda meeting: self._extract_meeting_documents(meeting, municipality),
+                meetings
+            )
+            for meeting, result in zip(meetings, results):
+                if isinstance(result, BaseException):
+                    errors.append(f"Failed to extract documents for meeting {meeting.title}: {result}")
+                else:
+                    all_documents.extend(result)
+            self._record_errors(session, errors)
                     
             session.documents = all_documents
             session.documents_found = len(all_documents)
             
             # Step 3: Download documents if requested
             if download_documents:
+                errors = []
                 downloaded_docs = []
-                for doc in all_documents:
-                    try:
-                        if await self._download_document(doc, municipality):
-                            downloaded_docs.append(doc)
-                            session.documents_downloaded += 1
-                    except Exception as e:
-                        error_msg = f"Failed to download document {doc.title}: {e}"
-                        session.error_log.append(error_msg)
-                        logger.warning(error_msg)
+                # Create municipality-specific download directory once
+                muni_dir = await self._ensure_dir(self.download_dir / municipality.name)
+                results = await self._run_bounded(
+                    lambda doc: self._download_document(doc, municipality, muni_dir=muni_dir),
+                    all_documents
+                )
+                for doc, result in zip(all_documents, results):
+                    if isinstance(result, BaseException):
+                        errors.append(f"Failed to download document {doc.title}: {result}")
+                    elif result:
+                        downloaded_docs.append(doc)
+                await self._save_validators(muni_dir)
+                session.documents_downloaded += len(downloaded_docs)
+                self._record_errors(session, errors)
                         
                 # Step 4: Extract protocol text from downloaded documents
+                errors = []
                 protocols = []
-                for doc in downloaded_docs:
-                    if doc.document_type == DocumentType.PROTOKOLL and doc.local_path:
-                        try:
-                            protocol = await self._extract_protocol_content(doc, municipality)
-                            if protocol:
-                                protocols.append(protocol)
-                                session.protocols_extracted += 1
-                        except Exception as e:
-                            error_msg = f"Failed to extract protocol from {doc.title}: {e}"
-                            session.error_log.append(error_msg)
-                            logger.warning(error_msg)
+                protocol_docs = [
+                    doc for doc in downloaded_docs
+                    if doc.document_type == DocumentType.PROTOKOLL and doc.local_path
+                ]
+                results = await self._run_bounded(
+                    lambda doc: self._extract_protocol_content(doc, municipality),
+                    protocol_docs
+                )
+                for doc, result in zip(protocol_docs, results):
+                    if isinstance(result, BaseException):
+                        errors.append(f"Failed to extract protocol from {doc.title}: {result}")
+                    elif result:
+                        protocols.append(result)
+                session.protocols_extracted += len(protocols)
+                self._record_errors(session, errors)
                             
                 session.protocols = protocols
                 
@@ -162,6 +351,131 @@ class ProtocolScraper:
         session.errors_encountered = len(session.error_log)
         return session
         
+    @staticmethod
+    def _record_errors(session: ScrapingSession, errors: List[str]) -> None:
+        """Log a step's errors and append them to the session in one go."""
+        for error_msg in errors:
+            logger.warning(error_msg)
+        session.error_log.extend(errors)
+
+    async def _fetch(self, url: str, browser_config: BrowserConfig) -> ScrapedContent:
+        """Render a page through the scraper, re-using earlier renders.
+
+        Concurrent requests for the same URL share a lock so the page is
+        only rendered once; failed renders are not cached.
+        """
+        cached = self._page_cache.get(url)
+        if cached is not None:
+            self._page_cache.move_to_end(url)
+            return cached
+
+        lock = self._page_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self._page_cache.move_to_end(url)
+                return cached
+
+            content = await self.scraper.scrape_single_url(url, browser_config)
+            if not content.error:
+                self._page_cache[url] = content
+                if len(self._page_cache) > self.page_cache_size:
+                    evicted, _ = self._page_cache.popitem(last=False)
+                    self._page_locks.pop(evicted, None)
+            return content
+
+    @asynccontextmanager
+    async def _get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """GET through the shared session, holding a download slot until done."""
+        async with self._download_semaphore:
+            async with self.session.get(url, headers=headers) as response:
+                yield response
+
+    async def _head(self, url: str) -> Dict[str, Optional[str]]:
+        """Fetch a document's size, type and validators without its body.
+
+        Returns an empty dict when the server rejects or fails the HEAD, so
+        callers fall back to a plain GET.
+        """
+        try:
+            async with self._download_semaphore:
+                async with self.session.head(url, allow_redirects=True) as response:
+                    if response.status >= 400:
+                        return {}
+                    headers = response.headers
+        except aiohttp.ClientError as e:
+            logger.debug(f"HEAD failed for {url}: {e}")
+            return {}
+
+        content_type = headers.get('Content-Type')
+        return {
+            'content_length': headers.get('Content-Length'),
+            'content_type': content_type.split(';', 1)[0].strip().lower() if content_type else None,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+
+    def _skip_reason(
+        self,
+        document: MeetingDocument,
+        head: Dict[str, Optional[str]],
+        max_file_size: int
+    ) -> Optional[str]:
+        """Explain why a HEAD response rules a document out, if it does."""
+        content_length = head.get('content_length')
+        if content_length and content_length.isdigit() and int(content_length) > max_file_size:
+            return f"file too large ({content_length} bytes > {max_file_size} bytes)"
+        content_type = head.get('content_type')
+        if content_type in PAGE_CONTENT_TYPES and document.file_format != 'html':
+            return f"unexpected content type {content_type}"
+        return None
+
+    async def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory off the event loop, at most once per path."""
+        if path not in self._ensured_dirs:
+            async with self._ensure_dir_lock:
+                if path not in self._ensured_dirs:
+                    await asyncio.to_thread(path.mkdir, parents=True, exist_ok=True)
+                    self._ensured_dirs.add(path)
+        return path
+
+    async def _load_validators(self, muni_dir: Path) -> Dict[str, Dict[str, str]]:
+        """Return the ETag/Last-Modified store for a download directory."""
+        validators = self._validators.get(muni_dir)
+        if validators is None:
+            validators = await asyncio.to_thread(_read_validators, muni_dir / VALIDATOR_SIDECAR)
+            validators = self._validators.setdefault(muni_dir, validators)
+        return validators
+
+    async def _save_validators(self, muni_dir: Path) -> None:
+        """Persist the validator store of a download directory, if loaded."""
+        validators = self._validators.get(muni_dir)
+        if validators is not None:
+            await asyncio.to_thread(
+                _write_validators, muni_dir / VALIDATOR_SIDECAR, dict(validators)
+            )
+
+    async def _run_bounded(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Sequence[T]
+    ) -> List[Union[R, BaseException]]:
+        """Run func over items concurrently, capped at the scraper's concurrency.
+
+        Results keep the order of items; exceptions are returned, not raised.
+        """
+        semaphore = asyncio.Semaphore(self.scraper.max_concurrent)
+
+        async def _bounded(item: T) -> R:
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(_bounded(item) for item in items), return_exceptions=True)
+
     async def _discover_meetings(
         self,
         municipality: Municipality,
@@ -191,7 +505,7 @@ class ProtocolScraper:
         
         try:
             # Scrape the main RIS page
-            content = await self.scraper.scrape_single_url(
+            content = await self._fetch(
                 str(municipality.ris_url),
                 BrowserConfig(headless=True, timeout=30000)
             )
@@ -226,7 +540,7 @@ class ProtocolScraper:
         meetings = []
         
         try:
-            content = await self.scraper.scrape_single_url(
+            content = await self._fetch(
                 str(municipality.ris_url),
                 BrowserConfig(headless=True, timeout=30000)
             )
@@ -240,7 +554,7 @@ class ProtocolScraper:
             # Test each link to see if it contains meeting information
             for link in potential_meeting_links[:max_meetings]:
                 try:
-                    meeting_content = await self.scraper.scrape_single_url(
+                    meeting_content = await self._fetch(
                         link,
                         BrowserConfig(headless=True, timeout=20000)
                     )
@@ -261,35 +575,58 @@ class ProtocolScraper:
     def _extract_regisafe_meeting_links(self, content: ScrapedContent) -> List[Tuple[str, Dict]]:
         """Extract meeting links from regisafe system."""
         meeting_links = []
+        discovered_at = datetime.now(timezone.utc)  # One timestamp per page
         
         # Look for typical regisafe meeting link patterns
-        for link in content.links:
-            if any(pattern in link.lower() for pattern in ['si010', 'to010', 'session']):
-                # Extract preliminary meeting info from the link/context if possible
-                preliminary_info = {
-                    'source_url': link,
-                    'discovered_at': datetime.now(timezone.utc)
-                }
-                meeting_links.append((link, preliminary_info))
+        for link in self._index_links(content)['regisafe']:
+            # Extract preliminary meeting info from the link/context if possible
+            preliminary_info = {
+                'source_url': link,
+                'discovered_at': discovered_at
+            }
+            meeting_links.append((link, preliminary_info))
                 
         return meeting_links
         
     def _extract_potential_meeting_links(self, content: ScrapedContent) -> List[str]:
         """Extract potential meeting links from generic systems."""
-        potential_links = []
-        
-        # Look for links containing meeting-related keywords
-        meeting_keywords = [
-            'sitzung', 'meeting', 'protokoll', 'tagesordnung', 
-            'gemeinderat', 'stadtrat', 'ausschuss'
-        ]
-        
+        # Links containing meeting-related keywords
+        return list(self._index_links(content)['meeting'])
+
+    def _index_links(self, content: ScrapedContent) -> Dict[str, List[str]]:
+        """Classify a page's links once into regisafe/meeting/document lists.
+
+        The index is cached per page URL (and checked against the page's link
+        list), so the link filters share a single pass over the links.
+        """
+        cached = self._link_index_cache.get(content.url)
+        if cached is not None and cached[0] is content.links:
+            self._link_index_cache.move_to_end(content.url)
+            return cached[1]
+
+        regisafe: List[str] = []
+        meeting: List[str] = []
+        document: List[str] = []
+        seen_documents: Set[str] = set()
+        regisafe_search = self.REGISAFE_LINK_RE.search
+        meeting_search = self.MEETING_LINK_RE.search
+        document_search = self.DOCUMENT_LINK_RE.search
+
         for link in content.links:
-            link_lower = link.lower()
-            if any(keyword in link_lower for keyword in meeting_keywords):
-                potential_links.append(link)
-                
-        return potential_links
+            if regisafe_search(link):
+                regisafe.append(link)
+            if meeting_search(link):
+                meeting.append(link)
+            # Pages often list the same document several times
+            if link not in seen_documents and document_search(link):
+                seen_documents.add(link)
+                document.append(link)
+
+        index = {'regisafe': regisafe, 'meeting': meeting, 'document': document}
+        self._link_index_cache[content.url] = (content.links, index)
+        if len(self._link_index_cache) > self.page_cache_size:
+            self._link_index_cache.popitem(last=False)
+        return index
         
     async def _scrape_meeting_details(
         self,
@@ -299,7 +636,7 @@ class ProtocolScraper:
     ) -> Optional[Meeting]:
         """Scrape detailed meeting information from a meeting page."""
         try:
-            content = await self.scraper.scrape_single_url(
+            content = await self._fetch(
                 meeting_url,
                 BrowserConfig(headless=True, timeout=20000)
             )
@@ -329,7 +666,7 @@ class ProtocolScraper:
                 meeting_date = datetime.now()  # Fallback
                 
             # Determine meeting type
-            meeting_type = self._determine_meeting_type(title + " " + content.text)
+            meeting_type = self._determine_meeting_type_multi(title, content.text)
             
             meeting = Meeting(
                 municipality_name=municipality.name,
@@ -368,7 +705,7 @@ class ProtocolScraper:
             
         try:
             # Re-scrape the meeting page to look for document links
-            content = await self.scraper.scrape_single_url(
+            content = await self._fetch(
                 str(meeting.source_url),
                 BrowserConfig(headless=True, timeout=20000)
             )
@@ -379,43 +716,47 @@ class ProtocolScraper:
             # Extract document links
             doc_links = self._extract_document_links(content)
             
-            for link_info in doc_links:
-                doc = MeetingDocument(
-                    municipality_name=municipality.name,
-                    meeting_id=meeting.meeting_id,
-                    title=link_info.get('title', 'Unbekanntes Dokument'),
-                    document_type=link_info.get('document_type', DocumentType.ANDERE),
-                    file_name=link_info.get('file_name'),
-                    file_format=link_info.get('file_format'),
-                    download_url=link_info.get('url'),
-                    download_status=ScrapingStatus.DISCOVERED
-                )
-                documents.append(doc)
+            documents = validate_many(MeetingDocument, (
+                {
+                    'municipality_name': municipality.name,
+                    'meeting_id': meeting.meeting_id,
+                    'title': link_info.title,
+                    'document_type': link_info.document_type,
+                    'file_name': link_info.file_name,
+                    'file_format': link_info.file_format,
+                    'download_url': link_info.url,
+                    'download_status': ScrapingStatus.DISCOVERED
+                }
+                for link_info in doc_links
+            ))
                 
         except Exception as e:
             logger.warning(f"Failed to extract documents for meeting {meeting.title}: {e}")
             
         return documents
         
-    def _extract_document_links(self, content: ScrapedContent) -> List[Dict]:
+    def _extract_document_links(self, content: ScrapedContent) -> List[_DocLinkInfo]:
         """Extract document download links from meeting page."""
         doc_links = []
         
-        for link in content.links:
-            # Check if link points to a document
-            if any(ext in link.lower() for ext in self.DOCUMENT_EXTENSIONS):
-                # Try to determine document type from filename or context
-                doc_type = self._guess_document_type(link)
-                file_format = self._extract_file_extension(link)
-                
-                doc_info = {
-                    'url': link,
-                    'title': self._extract_filename_from_url(link),
-                    'document_type': doc_type,
-                    'file_format': file_format,
-                    'file_name': self._extract_filename_from_url(link)
-                }
-                doc_links.append(doc_info)
+        # Unique links pointing to a document
+        for link in self._index_links(content)['document']:
+            # Try to determine document type from filename or context
+            doc_type = self._guess_document_type(link)
+            try:
+                path = urlparse(link).path
+            except ValueError:
+                path = ''
+            file_format = self._extension_from_path(path)
+            file_name = self._filename_from_path(path)
+            
+            doc_links.append(_DocLinkInfo(
+                url=link,
+                title=file_name,
+                document_type=doc_type,
+                file_format=file_format,
+                file_name=file_name
+            ))
                 
         return doc_links
         
@@ -423,7 +764,8 @@ class ProtocolScraper:
         self,
         document: MeetingDocument,
         municipality: Municipality,
-        max_file_size: int = DEFAULT_MAX_FILE_SIZE
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        muni_dir: Optional[Path] = None
     ) -> bool:
         """Download a meeting document.
 
@@ -431,23 +773,32 @@ class ProtocolScraper:
             document: The document to download
             municipality: The municipality this document belongs to
             max_file_size: Maximum allowed file size in bytes (default 100MB)
+            muni_dir: Existing download directory for the municipality;
+                created here when omitted
         """
         if not document.download_url or not self.session:
             return False
 
         try:
-            # Create municipality-specific download directory
-            muni_dir = self.download_dir / municipality.name
-            muni_dir.mkdir(parents=True, exist_ok=True)
+            if muni_dir is None:
+                # Create municipality-specific download directory
+                muni_dir = await self._ensure_dir(self.download_dir / municipality.name)
 
             # Generate local filename with sanitization
-            filename = document.file_name or f"document_{int(datetime.now().timestamp())}"
+            fallback_filename = "document"
+            filename = document.file_name or fallback_filename
             # Sanitize filename to prevent path traversal
             filename = os.path.basename(filename).replace('/', '').replace('\\', '')
             if not filename or filename in ('.', '..'):
-                filename = f"document_{int(datetime.now().timestamp())}"
-            if not any(filename.endswith(ext) for ext in self.DOCUMENT_EXTENSIONS):
+                filename = fallback_filename
+            if not self.DOCUMENT_LINK_RE.search(filename):
                 filename += f".{document.file_format or 'pdf'}"
+            # Suffix a hash of the full URL: RIS systems serve many documents
+            # from one path (getfile.pdf?id=1, ?id=2, ...)
+            url = str(document.download_url)
+            stem, ext = os.path.splitext(filename)
+            url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=4).hexdigest()
+            filename = f"{stem}_{url_hash}{ext}"
 
             local_path = muni_dir / filename
 
@@ -458,9 +809,38 @@ class ProtocolScraper:
                 logger.error(f"Path traversal attempt detected: {local_path}")
                 return False
 
+            # Revalidate instead of re-downloading when we hold the file and
+            # validators from an earlier run
+            validators = await self._load_validators(muni_dir)
+            stored = validators.get(url, {})
+            document.etag = document.etag or stored.get('etag')
+            document.last_modified = document.last_modified or stored.get('last_modified')
+            headers = {}
+            if await asyncio.to_thread(os.path.exists, local_path):
+                if document.etag:
+                    headers['If-None-Match'] = document.etag
+                if document.last_modified:
+                    headers['If-Modified-Since'] = document.last_modified
+
+            if not headers:
+                # Nothing to revalidate: check size and type before pulling
+                # the body, e.g. "document" links that lead to HTML overviews
+                head = await self._head(url)
+                skip_reason = self._skip_reason(document, head, max_file_size)
+                if skip_reason:
+                    logger.info(f"Skipping {url}: {skip_reason}")
+                    document.download_status = ScrapingStatus.SKIPPED
+                    return False
+
             # Download the file with size limit check
-            async with self.session.get(str(document.download_url)) as response:
-                if response.status == 200:
+            async with self._get(url, headers=headers) as response:
+                if response.status == 304 and headers:
+                    document.local_path = str(local_path)
+                    document.file_size_bytes = await asyncio.to_thread(os.path.getsize, local_path)
+                    document.download_status = ScrapingStatus.SCRAPED
+                    logger.info(f"Document unchanged, skipped download: {filename}")
+                    return True
+                elif response.status == 200:
                     # Check Content-Length header for file size
                     content_length = response.headers.get('Content-Length')
                     if content_length and int(content_length) > max_file_size:
@@ -470,26 +850,58 @@ class ProtocolScraper:
                         )
                         return False
 
-                    # Download with streaming and size tracking
+                    # Stream to a private temp file with size tracking: take
+                    # whatever aiohttp has ready and flush in large slices off
+                    # the event loop. Only a complete download replaces
+                    # local_path, so concurrent or failed downloads never
+                    # leave a mixed or truncated file behind.
                     downloaded_size = 0
-                    async with aiofiles.open(local_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
+                    completed = False
+                    fd, tmp_name = await asyncio.to_thread(
+                        tempfile.mkstemp, dir=muni_dir, prefix=f".{filename}.", suffix='.part'
+                    )
+                    try:
+                        buffer = bytearray()
+                        async for chunk in response.content.iter_any():
                             downloaded_size += len(chunk)
                             if downloaded_size > max_file_size:
                                 logger.warning(
                                     f"Download exceeded size limit ({max_file_size} bytes): "
                                     f"{document.download_url}"
                                 )
-                                # Clean up partial file
-                                await f.close()
-                                local_path.unlink(missing_ok=True)
                                 return False
-                            await f.write(chunk)
+                            buffer.extend(chunk)
+                            if len(buffer) >= DOWNLOAD_FLUSH_SIZE:
+                                await asyncio.to_thread(_write_all, fd, buffer)
+                                buffer = bytearray()
+                        if buffer:
+                            await asyncio.to_thread(_write_all, fd, buffer)
+                        # mkstemp creates the file 0600
+                        os.fchmod(fd, 0o644)
+                        completed = True
+                    finally:
+                        os.close(fd)
+                        if completed:
+                            await asyncio.to_thread(os.replace, tmp_name, local_path)
+                        else:
+                            # Clean up partial file
+                            os.unlink(tmp_name)
                             
                     document.local_path = str(local_path)
-                    document.file_size_bytes = local_path.stat().st_size
+                    document.file_size_bytes = downloaded_size
                     document.download_status = ScrapingStatus.SCRAPED
                     document.last_downloaded = datetime.now(timezone.utc)
+                    document.etag = response.headers.get('ETag')
+                    document.last_modified = response.headers.get('Last-Modified')
+                    if document.etag or document.last_modified:
+                        validators[url] = {
+                            key: value for key, value in (
+                                ('etag', document.etag),
+                                ('last_modified', document.last_modified)
+                            ) if value
+                        }
+                    else:
+                        validators.pop(url, None)
                     
                     logger.info(f"Downloaded document: {filename}")
                     return True
@@ -508,12 +920,11 @@ class ProtocolScraper:
         municipality: Municipality
     ) -> Optional[Protocol]:
         """Extract and parse content from a protocol document."""
-        if not document.local_path or not Path(document.local_path).exists():
+        if not document.local_path or not await asyncio.to_thread(os.path.exists, document.local_path):
             return None
             
         try:
-            # For now, just extract basic metadata
-            # Full PDF text extraction would require additional libraries
+            text = await self._extract_document_text(document.local_path)
             protocol = Protocol(
                 municipality_name=municipality.name,
                 meeting_id=document.meeting_id,
@@ -521,9 +932,9 @@ class ProtocolScraper:
                 title=document.title,
                 meeting_date=datetime.now(),  # Would extract from document
                 meeting_type=MeetingType.ANDERE,  # Would extract from document
-                full_text="[Text extraction not implemented]",
+                full_text=text if text is not None else "[Text extraction not implemented]",
                 source_document=document,
-                processed=False
+                processed=text is not None
             )
             
             return protocol
@@ -539,6 +950,16 @@ class ProtocolScraper:
         'oktober': 10, 'november': 11, 'dezember': 12
     }
 
+    # German long form with optional weekday,
+    # e.g. "Mittwoch, 15. Januar 2025" or "15. Januar 2025"
+    GERMAN_LONG_DATE_RE = re.compile(
+        r'(?:\w+,?\s+)?'  # Optional weekday with comma
+        r'(\d{1,2})\.\s*'  # Day with dot
+        r'(' + '|'.join(GERMAN_MONTHS.keys()) + r')\s+'  # German month name
+        r'(\d{4})',  # Year
+        re.IGNORECASE
+    )
+
     # Utility methods
 
     def _extract_meeting_date(self, text: str) -> Optional[datetime]:
@@ -550,90 +971,93 @@ class ProtocolScraper:
         - German long form with weekday (e.g., "Mittwoch, 15. Januar 2025")
         - German long form without weekday (e.g., "15. Januar 2025")
         """
-        text_lower = text.lower()
-
-        # Pattern 1: German long form with optional weekday
-        # e.g., "Mittwoch, 15. Januar 2025" or "15. Januar 2025"
-        german_long_pattern = (
-            r'(?:\w+,?\s+)?'  # Optional weekday with comma
-            r'(\d{1,2})\.\s*'  # Day with dot
-            r'(' + '|'.join(self.GERMAN_MONTHS.keys()) + r')\s+'  # German month name
-            r'(\d{4})'  # Year
-        )
-        match = re.search(german_long_pattern, text_lower)
+        # Pattern 1: German long form (case-insensitive, no lowered copy)
+        match = self.GERMAN_LONG_DATE_RE.search(text)
         if match:
             try:
                 day = int(match.group(1))
-                month = self.GERMAN_MONTHS[match.group(2)]
+                month = self.GERMAN_MONTHS[match.group(2).lower()]
                 year = int(match.group(3))
                 return datetime(year, month, day)
             except (ValueError, KeyError):
                 pass
 
-        # Pattern 2: DD.MM.YYYY
-        match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', text)
-        if match:
-            try:
-                day, month, year = match.groups()
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
-
-        # Pattern 3: YYYY-MM-DD
-        match = re.search(r'(\d{4})-(\d{1,2})-(\d{1,2})', text)
-        if match:
-            try:
-                year, month, day = match.groups()
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
+        # Pattern 2: DD.MM.YYYY, pattern 3: YYYY-MM-DD
+        for pattern, iso_order in ((_DATE_DDMMYYYY, False), (_DATE_ISO, True)):
+            match = pattern.search(text)
+            if match:
+                try:
+                    if iso_order:
+                        year, month, day = match.groups()
+                    else:
+                        day, month, year = match.groups()
+                    return datetime(int(year), int(month), int(day))
+                except ValueError:
+                    pass
 
         return None
         
     def _determine_meeting_type(self, text: str) -> MeetingType:
         """Determine meeting type from text content."""
-        text_lower = text.lower()
-        
-        for keyword, meeting_type in self.MEETING_TYPE_MAPPING.items():
-            if keyword in text_lower:
-                return meeting_type
-                
+        match = self.MEETING_TYPE_RE.search(text)
+        if match:
+            return self.MEETING_TYPE_MAPPING[match.lastgroup]
         return MeetingType.ANDERE
         
+    def _determine_meeting_type_multi(self, *texts: str) -> MeetingType:
+        """Determine meeting type from several texts, in priority order.
+
+        Scans each text separately instead of concatenating them, so a short
+        title that names the meeting type spares the body scan entirely.
+        """
+        for text in texts:
+            if text:
+                match = self.MEETING_TYPE_RE.search(text)
+                if match:
+                    return self.MEETING_TYPE_MAPPING[match.lastgroup]
+        return MeetingType.ANDERE
+
     def _guess_document_type(self, url: str) -> DocumentType:
         """Guess document type from URL or filename."""
-        url_lower = url.lower()
-        
-        for keyword, doc_type in self.DOCUMENT_TYPE_MAPPING.items():
-            if keyword in url_lower:
-                return doc_type
-                
+        match = self.DOCUMENT_TYPE_RE.search(url)
+        if match:
+            return self.DOCUMENT_TYPE_MAPPING[match.lastgroup]
         return DocumentType.ANDERE
         
     def _extract_file_extension(self, url: str) -> Optional[str]:
         """Extract file extension from URL."""
-        for ext in self.DOCUMENT_EXTENSIONS:
-            if url.lower().endswith(ext):
-                return ext[1:]  # Remove the dot
-        return None
+        try:
+            return self._extension_from_path(urlparse(url).path)
+        except ValueError:
+            return None
+
+    def _extension_from_path(self, path: str) -> Optional[str]:
+        """Extract a known document extension from a URL path."""
+        dot = path.rfind('.')
+        if dot < 0:
+            return None
+        ext = path[dot:].lower()
+        return ext[1:] if ext in self.DOCUMENT_EXTENSION_SET else None  # Remove the dot
         
     def _extract_filename_from_url(self, url: str) -> str:
-        """Extract and sanitize filename from URL.
+        """Extract and sanitize filename from URL."""
+        try:
+            return self._filename_from_path(urlparse(url).path)
+        except ValueError:
+            return "document"
 
-        Uses os.path.basename to prevent path traversal attacks.
+    def _filename_from_path(self, path: str) -> str:
+        """Extract and sanitize the filename from a URL path.
+
+        Keeps only the last path segment to prevent path traversal attacks.
         """
-        try:
-            parsed = urlparse(url)
-            # Use os.path.basename to get just the filename and prevent path traversal
-            filename = os.path.basename(parsed.path)
-            # Additional sanitization: remove any remaining path separators
-            filename = filename.replace('/', '').replace('\\', '')
-            # Ensure we have a valid filename
-            if not filename or filename in ('.', '..'):
-                return "document"
-            return filename
-        except Exception:
+        filename = path.rsplit('/', 1)[-1]
+        # Additional sanitization: remove any remaining path separators
+        filename = filename.replace('\\', '')
+        # Ensure we have a valid filename
+        if not filename or filename in ('.', '..'):
             return "document"
+        return filename
             
     async def _discover_sdnet_meetings(
         self,
@@ -0,0 +1,176 @@
+"""Parquet and JSONL export for municipal scraping results."""
+
+import logging
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import BaseModel, TypeAdapter
+
+from .data_models import Meeting, MeetingDocument, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Rows per Arrow record batch; bounds memory while streaming to disk
+DEFAULT_BATCH_ROWS = 10_000
+
+_TIMESTAMP = pa.timestamp('us', tz='UTC')
+# Meeting dates are parsed from RIS pages as naive local wall-clock times;
+# stored without a zone rather than mislabelled as UTC
+_LOCAL_TIMESTAMP = pa.timestamp('us')
+
+MEETING_SCHEMA = pa.schema([
+    ('municipality_name', pa.string()),
+    ('meeting_id', pa.string()),
+    ('title', pa.string()),
+    ('meeting_type', pa.string()),
+    ('date', _LOCAL_TIMESTAMP),
+    ('location', pa.string()),
+    ('committee', pa.string()),
+    ('is_public', pa.bool_()),
+    ('is_cancelled', pa.bool_()),
+    ('status', pa.string()),
+    ('source_url', pa.string()),
+    ('ris_provider', pa.string()),
+    ('scraping_status', pa.string()),
+    ('last_scraped', _TIMESTAMP),
+    ('created_at', _TIMESTAMP),
+    ('updated_at', _TIMESTAMP),
+])
+
+MEETING_DOCUMENT_SCHEMA = pa.schema([
+    ('municipality_name', pa.string()),
+    ('meeting_id', pa.string()),
+    ('title', pa.string()),
+    ('document_type', pa.string()),
+    ('file_name', pa.string()),
+    ('file_size_bytes', pa.int64()),
+    ('file_format', pa.string()),
+    ('download_url', pa.string()),
+    ('direct_access', pa.bool_()),
+    ('requires_session', pa.bool_()),
+    ('raw_text', pa.string()),
+    ('clean_text', pa.string()),
+    ('markdown_text', pa.string()),
+    ('local_path', pa.string()),
+    ('cloud_storage_path', pa.string()),
+    ('download_status', pa.string()),
+    ('last_downloaded', _TIMESTAMP),
+    ('etag', pa.string()),
+    ('last_modified', pa.string()),
+    ('created_at', _TIMESTAMP),
+    ('updated_at', _TIMESTAMP),
+])
+
+PROTOCOL_SCHEMA = pa.schema([
+    ('municipality_name', pa.string()),
+    ('meeting_id', pa.string()),
+    ('document_id', pa.string()),
+    ('title', pa.string()),
+    ('meeting_date', _LOCAL_TIMESTAMP),
+    ('meeting_type', pa.string()),
+    ('attendees', pa.list_(pa.string())),
+    ('topics', pa.list_(pa.string())),
+    ('decisions', pa.list_(pa.string())),
+    ('full_text', pa.string()),
+    ('summary', pa.string()),
+    ('key_points', pa.list_(pa.string())),
+    ('processed', pa.bool_()),
+    ('processing_date', _TIMESTAMP),
+    ('processing_notes', pa.string()),
+    ('created_at', _TIMESTAMP),
+    ('updated_at', _TIMESTAMP),
+])
+
+SCHEMAS: Dict[Type[BaseModel], pa.Schema] = {
+    Meeting: MEETING_SCHEMA,
+    MeetingDocument: MEETING_DOCUMENT_SCHEMA,
+    Protocol: PROTOCOL_SCHEMA,
+}
+
+
+def _column(rows: Sequence[BaseModel], name: str) -> List[Any]:
+    """Pull one field out of every row, unwrapping enums to their values."""
+    values = [getattr(row, name) for row in rows]
+    if any(isinstance(value, Enum) for value in values):
+        values = [value.value if isinstance(value, Enum) else value for value in values]
+    return values
+
+
+def to_record_batch(rows: Sequence[BaseModel], schema: pa.Schema) -> pa.RecordBatch:
+    """Convert models to an Arrow record batch, one column list per field."""
+    return pa.record_batch(
+        [pa.array(_column(rows, field.name), type=field.type) for field in schema],
+        schema=schema
+    )
+
+
+def write_parquet(
+    rows: Sequence[BaseModel],
+    path: Union[str, Path],
+    schema: Optional[pa.Schema] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    compression: str = "zstd"
+) -> str:
+    """Stream models to a Parquet file in fixed-size record batches.
+
+    Args:
+        rows: Meeting, MeetingDocument or Protocol instances (one type)
+        path: Destination file
+        schema: Arrow schema; looked up from the row type when omitted
+        batch_rows: Rows per record batch
+        compression: Parquet compression codec
+
+    Returns:
+        Path of the written file
+    """
+    if schema is None:
+        if not rows:
+            raise ValueError("schema is required when writing an empty row list")
+        schema = SCHEMAS[type(rows[0])]
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for start in range(0, len(rows), batch_rows):
+            writer.write_batch(to_record_batch(rows[start:start + batch_rows], schema))
+
+    logger.info(f"Wrote {len(rows)} rows to {path}")
+    return str(path)
+
+
+@lru_cache(maxsize=None)
+def _json_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Build (once per model) a TypeAdapter serializing that model."""
+    return TypeAdapter(model)
+
+
+def write_jsonl(rows: Sequence[BaseModel], path: Union[str, Path]) -> str:
+    """Write models as JSON Lines.
+
+    Each row is serialized straight to UTF-8 bytes by its model's cached
+    TypeAdapter and the lines are joined into one buffer, so there is no
+    per-row str round-trip.
+
+    Args:
+        rows: Model instances to export
+        path: Destination file
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    lines = [_json_adapter(type(row)).dump_json(row) for row in rows]
+    with open(path, 'wb') as f:
+        f.write(b'\n'.join(lines))
+        if lines:
+            f.write(b'\n')
+
+    logger.info(f"Wrote {len(rows)} rows to {path}")
+    return str(path)
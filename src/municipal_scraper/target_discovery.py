@@ -3,9 +3,17 @@
 import asyncio
 import logging
 import re
-from typing import List, Dict, Optional, Set
-from urllib.parse import urlparse, urljoin
+import socket
+from collections import OrderedDict
+from functools import lru_cache
+from html import unescape
+from html.entities import codepoint2name
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlparse, urljoin, urlsplit
 import aiohttp
+import lxml.html
+from asyncio_throttle import Throttler
+from lxml import etree
 
 from ..scraper import WebsiteScraper, BrowserConfig, ScrapedContent
 from .data_models import (
@@ -15,6 +23,83 @@ from .data_models import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONNECTION_LIMIT = 100  # Total pooled HTTP connections for probing
+DEFAULT_CONNECTIONS_PER_HOST = 10  # Pooled connections per candidate host
+DNS_CACHE_TTL = 600  # Seconds to cache resolved candidate hosts
+ANCHOR_CACHE_SIZE = 256  # Parsed pages kept for link extraction
+DEFAULT_PROBES_PER_SECOND = 5  # HEAD probes across all municipalities
+PROBE_TIMEOUT = 5  # Seconds allowed for a single HEAD probe
+PATTERN_MATCH_LIMIT = 3  # Stop probing URL patterns after this many hits
+RIS_SCORE_THRESHOLD = 0.3  # Minimum score for a page to count as a RIS
+RIS_CONFIDENT_SCORE = 0.8  # Stop verifying once a page scores this high
+
+# Name cleaning for URL generation, compiled once
+_RE_PREFIX = re.compile(r'^(Stadt|Gemeinde|Amt)\s+', re.IGNORECASE)
+_RE_SUFFIX = re.compile(r'\s+(Stadt|Gemeinde|Amt)$', re.IGNORECASE)
+_RE_NONALNUM = re.compile(r'[^a-z0-9]')
+_RE_DASHES = re.compile(r'-+')
+_UMLAUT_TABLE = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+
+
+def _html_literal(keyword: str) -> str:
+    """Regex for a keyword as it may appear in raw HTML.
+
+    Non-ASCII letters also match their named and numeric character
+    references, e.g. "ü" matches "&uuml;" and "&#252;".
+    """
+    parts = []
+    for char in keyword:
+        if char.isascii():
+            parts.append(re.escape(char))
+        else:
+            forms = [re.escape(char), f'&#0*{ord(char)};', f'&#x0*{ord(char):x};']
+            if ord(char) in codepoint2name:
+                forms.append(f'&{codepoint2name[ord(char)]};')
+            parts.append(f"(?:{'|'.join(forms)})")
+    return ''.join(parts)
+
+
+def _provider_regex(patterns: Dict[RISProvider, List[str]]) -> re.Pattern:
+    """Compile provider patterns into one case-insensitive alternation.
+
+    Each provider is a named group (its enum name), so a match maps back
+    to the provider through ``match.lastgroup``.
+    """
+    return re.compile(
+        '|'.join(
+            f"(?P<{provider.name}>{'|'.join(map(re.escape, provider_patterns))})"
+            for provider, provider_patterns in patterns.items()
+        ),
+        re.IGNORECASE
+    )
+
+
+@lru_cache(maxsize=4096)
+def _clean_name_for_url(name: str) -> str:
+    """Clean municipality name for URL generation."""
+    # Remove common prefixes/suffixes
+    name = _RE_PREFIX.sub('', name)
+    name = _RE_SUFFIX.sub('', name)
+    
+    # Convert to lowercase and replace special characters
+    name = name.lower().translate(_UMLAUT_TABLE)
+    name = _RE_NONALNUM.sub('-', name)
+    return _RE_DASHES.sub('-', name).strip('-')
+
+
+@lru_cache(maxsize=4096)
+def _main_website_urls(name: str) -> Tuple[str, ...]:
+    """Generate possible main website URLs for a municipality name."""
+    name_clean = _clean_name_for_url(name)
+    
+    # Add state-specific patterns if needed
+    return (
+        f"https://{name_clean}.de",
+        f"https://www.{name_clean}.de",
+        f"https://{name_clean}.com",
+        f"https://www.{name_clean}.com"
+    )
+
 
 class TargetDiscovery:
     """System for discovering German municipal RIS/Sitzungsdienst URLs."""
@@ -35,6 +120,12 @@ class TargetDiscovery:
         "ratsinfo-{name}.de"
     ]
     
+    # Patterns split once by the placeholder they use
+    DOMAIN_URL_PATTERNS = tuple(p for p in RIS_URL_PATTERNS if "{domain}" in p)
+    NAME_URL_PATTERNS = tuple(
+        p for p in RIS_URL_PATTERNS if "{name}" in p and "{domain}" not in p
+    )
+    
     # Known provider-specific patterns
     PROVIDER_PATTERNS = {
         RISProvider.REGISAFE: [
@@ -55,6 +146,19 @@ class TargetDiscovery:
         ]
     }
     
+    # Provider signatures in page HTML, in order of precedence
+    PROVIDER_HTML_SIGNATURES = {
+        RISProvider.REGISAFE: ["regisafe", "buergerinfo"],
+        RISProvider.SD_NET: ["sitzungsdienst.net", "sd-net"],
+        RISProvider.SESSIONNET: ["sessionnet"],
+        RISProvider.ALLRIS: ["allris"],
+        RISProvider.KOMMUNE_AKTIV: ["kommune-aktiv"],
+        RISProvider.SOMACOS: ["somacos"]
+    }
+    
+    PROVIDER_URL_RE = _provider_regex(PROVIDER_PATTERNS)
+    PROVIDER_HTML_RE = _provider_regex(PROVIDER_HTML_SIGNATURES)
+    
     # Keywords that indicate RIS/council systems
     RIS_KEYWORDS = [
         "ratsinformationssystem",
@@ -72,23 +176,70 @@ class TargetDiscovery:
         "fraktionen"
     ]
     
-    def __init__(self, scraper: Optional[WebsiteScraper] = None):
+    # All RIS keywords in one pass over raw HTML; the lookahead reports
+    # overlapping hits so every keyword present in the page is found
+    RIS_KEYWORD_RE = re.compile(
+        '(?=(' + '|'.join(_html_literal(keyword) for keyword in RIS_KEYWORDS) + '))',
+        re.IGNORECASE
+    )
+    SITZUNG_RE = re.compile('sitzung', re.IGNORECASE)
+    
+    def __init__(
+        self,
+        scraper: Optional[WebsiteScraper] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        probes_per_second: int = DEFAULT_PROBES_PER_SECOND
+    ):
+        """Initialize target discovery.
+
+        Args:
+            scraper: Browser scraper for website analysis and verification
+            session: Existing HTTP session to probe with; it is left open on
+                exit. A pooled session is created on entry when omitted.
+            probes_per_second: Rate limit for URL pattern HEAD probes
+        """
         self.scraper = scraper or WebsiteScraper(
             max_concurrent=3,
             requests_per_second=1.0
         )
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A scraper created here is ours to close; a passed-in one is not
+        self._owns_scraper = scraper is None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self.probe_throttler = Throttler(rate_limit=probes_per_second)
+        # Apex domain -> whether it exists in DNS
+        self._domain_exists: Dict[str, bool] = {}
+        # Verification outcome per normalized URL: the ranking entry, or None
+        # if the page loaded but is not a RIS
+        self._verify_cache: Dict[str, Optional[Dict]] = {}
+        # Parsed (href, anchor text) pairs per page URL
+        self._anchor_cache: "OrderedDict[str, Tuple[str, List[Tuple[str, str]]]]" = OrderedDict()
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'Mozilla/5.0 (compatible; MunicipalScraper/1.0)'}
-        )
+        if self.session is None:
+            # One keep-alive pool with cached DNS for every probe of every
+            # municipality in this discovery run
+            connector = aiohttp.TCPConnector(
+                limit=DEFAULT_CONNECTION_LIMIT,
+                limit_per_host=DEFAULT_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={'User-Agent': 'Mozilla/5.0 (compatible; MunicipalScraper/1.0)'}
+            )
+            self._owns_session = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+        if self._owns_scraper:
+            await self.scraper.aclose()
             
     async def discover_municipality_ris(self, municipality: Municipality) -> DiscoveryResult:
         """Discover RIS URL for a single municipality."""
@@ -108,6 +259,9 @@ class TargetDiscovery:
                 search_urls = await self._search_based_discovery(municipality)
                 result.discovered_urls.extend(search_urls)
             
+            # Strategies often find the same URL; verify each only once
+            result.discovered_urls = list(dict.fromkeys(result.discovered_urls))
+            
             # Verify and rank discovered URLs
             if result.discovered_urls:
                 verified = await self._verify_ris_urls(result.discovered_urls)
@@ -143,16 +297,20 @@ class TargetDiscovery:
         name_clean = self._clean_name_for_url(municipality.name)
         domain_base = f"{name_clean}.de"
         
+        # Subdomains of an apex that does not exist (NXDOMAIN) cannot
+        # exist either, so one lookup can rule out all of them
+        apex_exists = await self._domain_resolves(domain_base)
+        
         # Test pattern variations
-        for pattern in self.RIS_URL_PATTERNS:
-            if "{domain}" in pattern:
-                url = f"https://{pattern.format(domain=domain_base)}"
-            elif "{name}" in pattern:
-                url = f"https://{pattern.format(name=name_clean)}"
-            else:
-                continue
-                
-            candidate_urls.append(url)
+        if apex_exists:
+            fields = {'domain': domain_base}
+            candidate_urls.extend(
+                f"https://{pattern.format_map(fields)}" for pattern in self.DOMAIN_URL_PATTERNS
+            )
+        fields = {'name': name_clean}
+        candidate_urls.extend(
+            f"https://{pattern.format_map(fields)}" for pattern in self.NAME_URL_PATTERNS
+        )
             
         # Test URLs in parallel
         accessible_urls = []
@@ -164,37 +322,70 @@ class TargetDiscovery:
                     return url
                 return None
                 
-        tasks = [test_url(url) for url in candidate_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, str):
-                accessible_urls.append(result)
+        # Return as soon as enough candidates answer instead of waiting for
+        # the slowest (usually non-existent) host
+        pending = {asyncio.create_task(test_url(url)) for url in candidate_urls}
+        try:
+            while pending and len(accessible_urls) < PATTERN_MATCH_LIMIT:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None and task.result():
+                        accessible_urls.append(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
                 
-        return accessible_urls
+        return accessible_urls[:PATTERN_MATCH_LIMIT]
         
     async def _analyze_main_website(self, municipality: Municipality) -> List[str]:
         """Analyze municipality's main website for RIS links."""
         main_urls = self._generate_main_website_urls(municipality)
         discovered_urls = []
         
-        for main_url in main_urls:
+        async def analyze(main_url: str) -> List[str]:
             try:
-                # Scrape the main website
+                # Municipal homepages are almost always server-rendered: read
+                # their links over plain HTTP first
+                if self.session:
+                    try:
+                        html = await self._fetch_html(main_url)
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.debug(f"Main website {main_url} not reachable: {e}")
+                        return []
+                    if html:
+                        content = ScrapedContent(url=main_url, html=html, text="")
+                        if self._anchors(content):
+                            return self._extract_ris_links(content, main_url)
+                            
+                # No links in the raw HTML (JS-rendered) or not served as
+                # HTML to plain clients: render in the browser
                 content = await self.scraper.scrape_single_url(
                     main_url,
                     BrowserConfig(headless=True, timeout=20000)
                 )
                 
                 if content.error or not content.html:
-                    continue
+                    return []
                     
                 # Look for RIS-related links
-                ris_links = self._extract_ris_links(content, main_url)
-                discovered_urls.extend(ris_links)
+                return self._extract_ris_links(content, main_url)
                 
             except Exception as e:
                 logger.warning(f"Failed to analyze main website {main_url}: {e}")
+                return []
+                
+        # Load all candidate main sites at once; the first one that links to
+        # a RIS wins and the remaining navigations are cancelled
+        tasks = [asyncio.create_task(analyze(main_url)) for main_url in main_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                ris_links = await next_done
+                if ris_links:
+                    discovered_urls.extend(ris_links)
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
                 
         return discovered_urls
         
@@ -207,168 +398,292 @@ class TargetDiscovery:
         return []
         
     async def _verify_ris_urls(self, urls: List[str]) -> List[Dict]:
-        """Verify URLs actually contain RIS systems and rank by quality."""
+        """Verify URLs actually contain RIS systems and rank by quality.
+
+        Outcomes are cached per URL, so RIS hosts shared by several
+        municipalities are only rendered once per discovery run.
+        """
         verified = []
+        to_scrape = []
         
         for url in urls:
-            try:
-                # Scrape the potential RIS page
-                content = await self.scraper.scrape_single_url(
-                    url,
-                    BrowserConfig(headless=True, timeout=15000)
-                )
+            key = self._verify_key(url)
+            if key not in self._verify_cache:
+                to_scrape.append(url)
+            elif self._verify_cache[key]:
+                verified.append(self._verify_cache[key])
                 
-                if content.error:
-                    continue
-                    
-                # Analyze content for RIS indicators
-                ris_score = self._calculate_ris_score(content)
-                provider = self._detect_provider(content)
-                
-                if ris_score > 0.3:  # Threshold for RIS detection
-                    verified.append({
-                        'url': url,
-                        'score': ris_score,
-                        'provider': provider,
-                        'accessible': True
-                    })
+        # Most RIS pages are server-rendered: score them over plain HTTP on
+        # the pooled session and only render the ones that do not pass
+        to_render = to_scrape
+        if to_scrape and self.session:
+            entries = await asyncio.gather(*(self._verify_over_http(url) for url in to_scrape))
+            to_render = []
+            for url, entry in zip(to_scrape, entries):
+                if entry:
+                    verified.append(entry)
+                    self._verify_cache[self._verify_key(url)] = entry
+                else:
+                    to_render.append(url)
                     
-            except Exception as e:
-                logger.warning(f"Failed to verify RIS URL {url}: {e}")
+        if to_render and not any(entry['score'] >= RIS_CONFIDENT_SCORE for entry in verified):
+            # Load the rest concurrently on one browser and score them as
+            # they arrive; a confident match ends verification early
+            pages = self.scraper.scrape_as_completed(
+                to_render,
+                BrowserConfig(headless=True, timeout=15000)
+            )
+            try:
+                async for content in pages:
+                    if content.error:
+                        continue
+                        
+                    try:
+                        entry = self._score_page(content)
+                    except Exception as e:
+                        logger.warning(f"Failed to verify RIS URL {content.url}: {e}")
+                        continue
+                        
+                    self._verify_cache[self._verify_key(content.url)] = entry
+                    if entry:
+                        verified.append(entry)
+                        if entry['score'] >= RIS_CONFIDENT_SCORE:
+                            break
+            finally:
+                await pages.aclose()
                 
         # Sort by score (highest first)
         verified.sort(key=lambda x: x['score'], reverse=True)
         return verified
         
+    async def _domain_resolves(self, domain: str) -> bool:
+        """Check once per domain whether DNS knows it.
+
+        Only a definite "no such name" answer counts as missing; timeouts
+        and empty answers (the apex may have no A record while its
+        subdomains do) are treated as existing.
+        """
+        exists = self._domain_exists.get(domain)
+        if exists is None:
+            try:
+                await asyncio.get_running_loop().getaddrinfo(domain, 443, type=socket.SOCK_STREAM)
+                exists = True
+            except socket.gaierror as e:
+                exists = e.errno != socket.EAI_NONAME
+            self._domain_exists[domain] = exists
+        return exists
+        
+    def _score_page(self, content: ScrapedContent) -> Optional[Dict]:
+        """Rank a loaded page, or return None if it does not look like a RIS."""
+        # Analyze content for RIS indicators
+        ris_score = self._calculate_ris_score(content)
+        if ris_score <= RIS_SCORE_THRESHOLD:
+            return None
+        return {
+            'url': content.url,
+            'score': ris_score,
+            'provider': self._detect_provider(content),
+            'accessible': True
+        }
+        
+    async def _verify_over_http(self, url: str) -> Optional[Dict]:
+        """Score a candidate from its raw HTML; None means it needs rendering."""
+        try:
+            html = await self._fetch_html(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Plain HTTP verification failed for {url}: {e}")
+            return None
+        if not html:
+            return None
+        return self._score_page(ScrapedContent(url=url, html=html, text=""))
+        
+    async def _fetch_html(self, url: str) -> Optional[str]:
+        """GET a page over the shared HTTP session.
+
+        Returns None when the response is not a successful HTML page;
+        connection errors propagate.
+        """
+        async with self.probe_throttler:
+            async with self.session.get(url) as response:
+                if response.status != 200 or response.content_type != 'text/html':
+                    return None
+                return await response.text(errors='replace')
+                
+    @staticmethod
+    def _verify_key(url: str) -> str:
+        """Normalize a URL for the verification cache (case-insensitive host)."""
+        parts = urlsplit(url)
+        return parts._replace(
+            scheme=parts.scheme.lower(),
+            netloc=parts.netloc.lower(),
+            path=parts.path.rstrip('/')
+        ).geturl()
+        
     async def _test_url_accessibility(self, url: str) -> bool:
-        """Test if URL is accessible."""
+        """Test if URL is accessible.
+
+        Only the first hop is checked: a 2xx, or a 3xx pointing elsewhere,
+        shows the host is live without following the redirect chain.
+        """
         if not self.session:
             return False
             
         try:
-            async with self.session.head(url, allow_redirects=True) as response:
-                return response.status == 200
+            async with self.probe_throttler:
+                async with self.session.head(
+                    url,
+                    allow_redirects=False,
+                    timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)
+                ) as response:
+                    if 300 <= response.status < 400:
+                        return 'Location' in response.headers
+                    return 200 <= response.status < 300
         except Exception:
             return False
             
     def _clean_name_for_url(self, name: str) -> str:
-        """Clean municipality name for URL generation."""
-        # Remove common prefixes/suffixes
-        name = re.sub(r'^(Stadt|Gemeinde|Amt)\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+(Stadt|Gemeinde|Amt)$', '', name, flags=re.IGNORECASE)
-        
-        # Convert to lowercase and replace special characters
-        name = name.lower()
-        name = re.sub(r'[äöü]', lambda m: {'ä': 'ae', 'ö': 'oe', 'ü': 'ue'}[m.group()], name)
-        name = re.sub(r'[ß]', 'ss', name)
-        name = re.sub(r'[^a-z0-9]', '-', name)
-        name = re.sub(r'-+', '-', name).strip('-')
-        
-        return name
+        """Clean municipality name for URL generation (cached per name)."""
+        return _clean_name_for_url(name)
         
     def _generate_main_website_urls(self, municipality: Municipality) -> List[str]:
         """Generate possible main website URLs for municipality."""
-        name_clean = self._clean_name_for_url(municipality.name)
-        
-        urls = [
-            f"https://{name_clean}.de",
-            f"https://www.{name_clean}.de",
-            f"https://{name_clean}.com",
-            f"https://www.{name_clean}.com"
-        ]
-        
-        # Add state-specific patterns if needed
-        return urls
+        return list(_main_website_urls(municipality.name))
         
     def _extract_ris_links(self, content: ScrapedContent, base_url: str) -> List[str]:
         """Extract RIS-related links from webpage content."""
         ris_links = []
+        seen: Set[str] = set()
+        keyword_search = self.RIS_KEYWORD_RE.search
         
-        # Look for links containing RIS keywords
-        for link in content.links:
-            link_lower = link.lower()
-            link_text = ""  # Would need to extract link text from HTML
-            
-            # Check URL and link text for RIS indicators
-            for keyword in self.RIS_KEYWORDS:
-                if keyword in link_lower or keyword in link_text.lower():
-                    # Convert relative URLs to absolute
-                    full_url = urljoin(base_url, link)
-                    if full_url not in ris_links:
-                        ris_links.append(full_url)
-                    break
+        # Check URL and link text for RIS indicators
+        for link, link_text in self._anchors(content):
+            if keyword_search(link) or keyword_search(link_text):
+                # Convert relative URLs to absolute
+                full_url = urljoin(base_url, link)
+                if full_url not in seen:
+                    seen.add(full_url)
+                    ris_links.append(full_url)
                     
         return ris_links
         
+    def _anchors(self, content: ScrapedContent) -> List[Tuple[str, str]]:
+        """Return (href, anchor text) pairs for a page, parsing its HTML once.
+
+        Falls back to the scraped link list (without text) when the page
+        has no parseable HTML.
+        """
+        cached = self._anchor_cache.get(content.url)
+        if cached is not None and cached[0] is content.html:
+            self._anchor_cache.move_to_end(content.url)
+            return cached[1]
+            
+        anchors = []
+        if content.html:
+            try:
+                tree = lxml.html.fromstring(content.html)
+                anchors = [
+                    (href, anchor.text_content())
+                    for anchor in tree.iter('a')
+                    if (href := anchor.get('href'))
+                ]
+            except (etree.ParserError, ValueError):
+                pass
+        if not anchors:
+            anchors = [(link, "") for link in content.links]
+            
+        self._anchor_cache[content.url] = (content.html, anchors)
+        if len(self._anchor_cache) > ANCHOR_CACHE_SIZE:
+            self._anchor_cache.popitem(last=False)
+        return anchors
+        
     def _calculate_ris_score(self, content: ScrapedContent) -> float:
-        """Calculate likelihood that content represents a RIS system."""
+        """Calculate likelihood that content represents a RIS system.
+
+        Keywords are scored as they are found, and the scan stops as soon
+        as the score reaches its 1.0 cap.
+        """
+        # The rendered text is contained in the HTML, so only the HTML is
+        # scanned (the text serves pages without HTML); no lowercased copy
+        page = content.html or content.text
+        found: Set[str] = set()
+        has_sitzung = False
         score = 0.0
-        text_lower = (content.text + " " + content.html).lower()
         
+        for match in self.RIS_KEYWORD_RE.finditer(page):
+            keyword = unescape(match.group(1).lower())
+            if keyword in found:
+                continue
+            found.add(keyword)
+            if keyword == "tagesordnung":
+                has_sitzung = self.SITZUNG_RE.search(page) is not None
+            score = self._keyword_score(found, has_sitzung)
+            if score >= 1.0:
+                break
+                
+        return min(score, 1.0)
+        
+    @staticmethod
+    def _keyword_score(found: Set[str], has_sitzung: bool) -> float:
+        """Score a set of found RIS keywords."""
         # Check for RIS keywords
-        keyword_matches = sum(1 for keyword in self.RIS_KEYWORDS if keyword in text_lower)
-        score += min(keyword_matches * 0.2, 0.8)  # Max 0.8 from keywords
+        score = min(len(found) * 0.2, 0.8)  # Max 0.8 from keywords
         
         # Check for typical RIS page elements
-        if "sitzung" in text_lower and "tagesordnung" in text_lower:
+        if has_sitzung and "tagesordnung" in found:
             score += 0.3
-        if "gemeinderat" in text_lower or "stadtrat" in text_lower:
+        if "gemeinderat" in found or "stadtrat" in found:
             score += 0.2
-        if "protokoll" in text_lower or "niederschrift" in text_lower:
+        if "protokoll" in found or "niederschrift" in found:
             score += 0.2
             
-        return min(score, 1.0)
+        return score
         
     def _detect_provider(self, content: ScrapedContent) -> RISProvider:
         """Detect RIS provider from content."""
-        url_lower = content.url.lower()
-        html_lower = content.html.lower()
+        # Check URL patterns, then HTML content for provider signatures
+        return (
+            self._first_provider(self.PROVIDER_URL_RE, content.url)
+            or self._first_provider(self.PROVIDER_HTML_RE, content.html)
+            or RISProvider.UNKNOWN
+        )
         
-        # Check URL patterns
-        for provider, patterns in self.PROVIDER_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    return provider
-                    
-        # Check HTML content for provider signatures
-        if "regisafe" in html_lower or "buergerinfo" in html_lower:
-            return RISProvider.REGISAFE
-        elif "sitzungsdienst.net" in html_lower or "sd-net" in html_lower:
-            return RISProvider.SD_NET
-        elif "sessionnet" in html_lower:
-            return RISProvider.SESSIONNET
-        elif "allris" in html_lower:
-            return RISProvider.ALLRIS
-        elif "kommune-aktiv" in html_lower:
-            return RISProvider.KOMMUNE_AKTIV
-        elif "somacos" in html_lower:
-            return RISProvider.SOMACOS
-            
-        return RISProvider.UNKNOWN
+    @staticmethod
+    def _first_provider(regex: re.Pattern, text: str) -> Optional[RISProvider]:
+        """Scan text once; if several providers match, the first listed wins."""
+        found = {match.lastgroup for match in regex.finditer(text)}
+        for name in regex.groupindex:
+            if name in found:
+                return RISProvider[name]
+        return None
         
     async def discover_multiple_municipalities(
         self,
         municipalities: List[Municipality],
         batch_size: int = 10
     ) -> List[DiscoveryResult]:
-        """Discover RIS URLs for multiple municipalities in batches."""
-        results = []
+        """Discover RIS URLs for multiple municipalities.
+
+        Up to batch_size municipalities are processed at a time; request
+        rates are limited per request by the probe and scraper throttlers.
+        """
+        semaphore = asyncio.Semaphore(batch_size)
+        completed = 0
         
-        for i in range(0, len(municipalities), batch_size):
-            batch = municipalities[i:i + batch_size]
-            logger.info(f"Processing discovery batch {i//batch_size + 1}/{(len(municipalities) + batch_size - 1)//batch_size}")
-            
-            # Process batch in parallel
-            tasks = [self.discover_municipality_ris(municipality) for municipality in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in batch_results:
-                if isinstance(result, DiscoveryResult):
-                    results.append(result)
-                else:
-                    logger.error(f"Discovery task failed: {result}")
-                    
-            # Small delay between batches to be respectful
-            await asyncio.sleep(2)
+        async def discover(municipality: Municipality) -> DiscoveryResult:
+            nonlocal completed
+            async with semaphore:
+                result = await self.discover_municipality_ris(municipality)
+            completed += 1
+            if completed % batch_size == 0:
+                logger.info(f"Completed discovery for {completed}/{len(municipalities)} municipalities")
+            return result
             
-        return results
\ No newline at end of file
+        results = []
+        tasks = [discover(municipality) for municipality in municipalities]
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, DiscoveryResult):
+                results.append(result)
+            else:
+                logger.error(f"Discovery task failed: {result}")
+                
+        return results
@@ -83,49 +83,56 @@ def main():
         )
 
         # Initialize scraper
-        scraper = WebsiteScraper(
+        async with WebsiteScraper(
             max_concurrent=args.max_concurrent,
             requests_per_second=args.rate_limit,
             storage_config=storage_config
-        )
-        
-        if args.file:
-            # Scrape from file
-            result_path = await scraper.scrape_from_file(
-                args.file,
-                url_column=args.url_column,
-                browser_config=browser_config
-            )
-            print(f"Scraping completed. Results saved to: {result_path}")
-            
-        elif args.urls:
-            # Scrape multiple URLs
-            results = await scraper.scrape_multiple_urls(
-                args.urls,
-                browser_config=browser_config
-            )
-            print(f"Scraped {len(results)} URLs")
-            
-        elif args.url:
-            # Scrape single website
-            request = ScrapingRequest(
-                url=args.url,
-                max_pages=args.max_pages,
-                follow_links=args.follow_links,
-                browser_config=browser_config
-            )
-            
-            result = await scraper.scrape_website(request)
-            print(f"Scraping completed with status: {result.status}")
-            print(f"Total pages: {result.total_pages}")
-            print(f"Successful: {result.successful_pages}")
-            print(f"Failed: {result.failed_pages}")
-            if result.duration:
-                print(f"Duration: {result.duration:.2f} seconds")
+        ) as scraper:
+
+            if args.file:
+                # Scrape from file
+                result_path = await scraper.scrape_from_file(
+                    args.file,
+                    url_column=args.url_column,
+                    browser_config=browser_config
+                )
+                print(f"Scraping completed. Results saved to: {result_path}")
+
+            elif args.urls:
+                # Scrape multiple URLs
+                results = await scraper.scrape_multiple_urls(
+                    args.urls,
+                    browser_config=browser_config
+                )
+                print(f"Scraped {len(results)} URLs")
+
+            elif args.url:
+                # Scrape single website
+                request = ScrapingRequest(
+                    url=args.url,
+                    max_pages=args.max_pages,
+                    follow_links=args.follow_links,
+                    browser_config=browser_config
+                )
+
+                result = await scraper.scrape_website(request)
+                print(f"Scraping completed with status: {result.status}")
+                print(f"Total pages: {result.total_pages}")
+                print(f"Successful: {result.successful_pages}")
+                print(f"Failed: {result.failed_pages}")
+                if result.duration:
+                    print(f"Duration: {result.duration:.2f} seconds")
     
-    # Run the async function
+    # Run the async function, on uvloop when it is installed: cheaper task
+    # and executor dispatch for large save/scrape fan-outs
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
     try:
-        asyncio.run(run_scraper())
+        asyncio.run(run_scraper(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         print("\nScraping interrupted by user")
         sys.exit(1)
@@ -1,38 +1,134 @@
 """Browser management for async web scraping."""
 import asyncio
+import copy
 import logging
 import random
+import re
 import time
-from typing import Optional, List, Dict, Any
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import Executor
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urljoin
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Error as PlaywrightError
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+import lxml.html
+from lxml.etree import ParserError
 import trafilatura
 
 from .models import BrowserConfig, ProxyConfig, ScrapedContent, ScrapingStatus
 
 logger = logging.getLogger(__name__)
 
+# Extra page.goto attempts for transient network errors
+NAVIGATION_RETRIES = 2
+_TRANSIENT_NET_ERROR_RE = re.compile(
+    r'net::ERR_(?:CONNECTION_(?:RESET|CLOSED|ABORTED|REFUSED)|EMPTY_RESPONSE'
+    r'|NETWORK_CHANGED|TIMED_OUT|HTTP2_PROTOCOL_ERROR)'
+)
+
+# Absolute http(s) URL with a host, checked after resolving each href
+_HTTP_URL_RE = re.compile(r'https?://[^/?#\s]', re.IGNORECASE)
+
+# Collects everything scrape_page reads from the DOM in a single evaluate.
+# Custom selectors run first, before scripts and styles are stripped for
+# the body text; a selector that throws reports {error} instead.
+_EXTRACT_PAGE_JS = """
+(selectors) => {
+    const custom = {};
+    for (const [key, selector] of Object.entries(selectors)) {
+        try {
+            const element = document.querySelector(selector);
+            custom[key] = element ? element.innerText : null;
+        } catch (e) {
+            custom[key] = {error: String(e)};
+        }
+    }
+    const links = Array.from(document.querySelectorAll('a[href]'), a => a.href);
+    const images = Array.from(document.querySelectorAll('img[src]'), img => img.src);
+    document.querySelectorAll('script, style, noscript').forEach(el => el.remove());
+    return {
+        title: document.title,
+        text: document.body ? document.body.innerText : '',
+        links,
+        images,
+        custom,
+    };
+}
+"""
+
+# File extensions blocked over CDP for each Playwright resource type
+BLOCKED_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif"),
+    "stylesheet": ("css",),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav", "m4a"),
+}
+
+
+def blocked_url_patterns(resource_types: List[str]) -> Tuple[List[str], List[str]]:
+    """Split resource types into CDP URL patterns and types with no pattern.
+
+    Network.setBlockedURLs matches whole URLs, so each extension is blocked
+    both bare and followed by a query string.
+    """
+    patterns = []
+    unmatched = []
+    for resource_type in resource_types:
+        extensions = BLOCKED_EXTENSIONS.get(resource_type)
+        if extensions is None:
+            unmatched.append(resource_type)
+            continue
+        for ext in extensions:
+            patterns.extend((f"*.{ext}", f"*.{ext}?*"))
+    return patterns, unmatched
+
+
+def extract_clean_text(html: str, markdown: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """Run trafilatura on HTML, returning (clean text, markdown).
+
+    Module-level so it can be shipped to a process pool; both formats are
+    produced in one call so the HTML is only pickled once. The markdown
+    pass is skipped (returning None) when markdown is False.
+
+    The HTML is parsed once; trafilatura prunes the tree it is given, so
+    the text pass works on a copy when the markdown pass still needs it.
+    """
+    tree = trafilatura.load_html(html)
+    if tree is None:
+        return None, None
+
+    text_clean = trafilatura.extract(copy.deepcopy(tree) if markdown else tree, output_format='txt')
+    text_markdown = trafilatura.extract(tree, output_format='markdown') if markdown else None
+    return text_clean, text_markdown
+
 
 class BrowserManager:
     """Manages browser instances and page operations."""
     
-    DEFAULT_USER_AGENTS = [
+    DEFAULT_USER_AGENTS = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:120.0) Gecko/20100101 Firefox/120.0"
-    ]
+    )
     
-    def __init__(self, config: Optional[BrowserConfig] = None, proxy_config: Optional[ProxyConfig] = None):
+    def __init__(
+        self,
+        config: Optional[BrowserConfig] = None,
+        proxy_config: Optional[ProxyConfig] = None,
+        extract_executor: Optional[Executor] = None
+    ):
         self.config = config or BrowserConfig()
         self.proxy_config = proxy_config
+        # Where trafilatura runs; None uses the loop's default thread pool
+        self.extract_executor = extract_executor
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        # Blocked per page over CDP, which keeps Chromium's HTTP cache on;
+        # types without a URL pattern fall back to context.route
+        self._blocked_urls, routed_types = blocked_url_patterns(self.config.block_resources)
+        self._routed_types = frozenset(routed_types)  # checked per sub-request
         
     async def __aenter__(self):
         await self.start()
@@ -92,8 +188,9 @@ class BrowserManager:
             
             self.context = await self.browser.new_context(**context_options)
             
-            # Set up request interception if resource blocking is enabled
-            if self.config.block_resources:
+            # Routing disables the HTTP cache, so only use it for resource
+            # types that cannot be blocked by URL pattern
+            if self._routed_types:
                 await self.context.route("**/*", self._intercept_request)
                 
         except Exception as e:
@@ -104,7 +201,7 @@ class BrowserManager:
     async def _intercept_request(self, route, request):
         """Intercept and potentially block requests."""
         try:
-            if request.resource_type in self.config.block_resources:
+            if request.resource_type in self._routed_types:
                 await route.abort()
             else:
                 await route.continue_()
@@ -113,6 +210,12 @@ class BrowserManager:
         except Exception as e:
             logger.error(f"Unexpected error in request interception: {e}")
             
+    async def _block_urls(self, page: Page):
+        """Block configured resource URLs on a page via the DevTools protocol."""
+        cdp = await self.context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": self._blocked_urls})
+
     async def close(self):
         """Close the browser and all resources."""
         try:
@@ -128,81 +231,96 @@ class BrowserManager:
         except Exception as e:
             logger.error(f"Error closing browser: {e}")
             
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def scrape_page(self, url: str, custom_selectors: Optional[Dict[str, str]] = None) -> ScrapedContent:
-        """Scrape a single page."""
+    async def scrape_page(
+        self,
+        url: str,
+        custom_selectors: Optional[Dict[str, str]] = None,
+        config: Optional[BrowserConfig] = None
+    ) -> ScrapedContent:
+        """Scrape a single page.
+
+        Args:
+            url: Page to load
+            custom_selectors: Named CSS selectors whose text is captured
+            config: Per-page settings (timeout, load state, size limit,
+                markdown); defaults to the manager's launch config
+        """
+        config = config or self.config
         if not self.context:
             raise RuntimeError("Browser not started. Use async context manager or call start() first.")
             
         page: Optional[Page] = None
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             page = await self.context.new_page()
+            if self._blocked_urls:
+                await self._block_urls(page)
             
-            # Navigate to the page
-            response = await page.goto(
-                str(url), 
-                wait_until=self.config.wait_for_load_state,
-                timeout=self.config.timeout
-            )
+            # Navigate to the page, retrying transient network errors on
+            # the same page
+            attempt = 0
+            while True:
+                try:
+                    response = await page.goto(
+                        str(url),
+                        wait_until=config.wait_for_load_state,
+                        timeout=config.timeout
+                    )
+                    break
+                except PlaywrightError as e:
+                    if attempt >= NAVIGATION_RETRIES or not _TRANSIENT_NET_ERROR_RE.search(str(e)):
+                        raise
+                    attempt += 1
+                    logger.warning(f"Navigation to {url} failed ({e}), retrying ({attempt}/{NAVIGATION_RETRIES})")
+                    await asyncio.sleep(random.uniform(0.2, 0.8))
             
-            # Wait for any dynamic content
-            await asyncio.sleep(1)
+            # Wait for dynamic content only where the config names a marker
+            if config.wait_for_selector:
+                try:
+                    await page.wait_for_selector(config.wait_for_selector, timeout=config.timeout)
+                except PlaywrightError as e:
+                    logger.warning(f"Selector {config.wait_for_selector!r} not found on {url}: {e}")
             
             # Extract content with size limit check
             html = await page.content()
 
             # Enforce content size limit to prevent OOM/DoS
-            if len(html) > self.config.max_content_size:
+            if len(html) > config.max_content_size:
                 error_msg = (
                     f"Content size ({len(html)} bytes) exceeds limit "
-                    f"({self.config.max_content_size} bytes) for {url}"
+                    f"({config.max_content_size} bytes) for {url}"
                 )
                 logger.warning(error_msg)
                 # Truncate to limit
-                html = html[:self.config.max_content_size]
+                html = html[:config.max_content_size]
 
-            title = await page.title()
-            
-            # Extract text content
-            text = await page.evaluate("""
-                () => {
-                    const scripts = document.querySelectorAll('script, style, noscript');
-                    scripts.forEach(script => script.remove());
-                    return document.body ? document.body.innerText : '';
-                }
-            """)
+            # Title, text, links, images and custom selectors in one round-trip
+            extracted = await page.evaluate(_EXTRACT_PAGE_JS, custom_selectors or {})
+            title = extracted["title"]
+            text = extracted["text"]
+            links = extracted["links"]
+            images = extracted["images"]
             
             # Extract clean text using trafilatura
             text_clean = None
             text_markdown = None
             try:
-                text_clean = trafilatura.extract(html, output_format='txt')
-                text_markdown = trafilatura.extract(html, output_format='markdown')
+                text_clean, text_markdown = await asyncio.get_running_loop().run_in_executor(
+                    self.extract_executor, extract_clean_text, html, config.extract_markdown
+                )
             except Exception as e:
                 logger.warning(f"Trafilatura extraction failed for {url}: {e}")
             
-            # Extract links
-            links = await page.evaluate("""
-                () => Array.from(document.querySelectorAll('a[href]'), a => a.href)
-            """)
-            
-            # Extract images
-            images = await page.evaluate("""
-                () => Array.from(document.querySelectorAll('img[src]'), img => img.src)
-            """)
-            
-            # Extract custom data if selectors provided
+            # Custom data from the selectors that matched
             metadata = {}
-            if custom_selectors:
-                for key, selector in custom_selectors.items():
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            metadata[key] = await element.inner_text()
-                    except Exception as e:
-                        logger.warning(f"Failed to extract {key} with selector {selector}: {e}")
+            for key, value in extracted["custom"].items():
+                if isinstance(value, dict):
+                    logger.warning(
+                        f"Failed to extract {key} with selector {custom_selectors[key]}: {value['error']}"
+                    )
+                elif value is not None:
+                    metadata[key] = value
             
             # Extract additional metadata
             metadata.update({
@@ -218,7 +336,7 @@ class BrowserManager:
                 "image_count": len(images)
             })
             
-            load_time = time.time() - start_time
+            load_time = time.perf_counter() - start_time
             
             return ScrapedContent(
                 url=str(url),
@@ -243,7 +361,7 @@ class BrowserManager:
                 text="",
                 text_clean=None,
                 text_markdown=None,
-                load_time=time.time() - start_time,
+                load_time=time.perf_counter() - start_time,
                 error=error_msg
             )
             
@@ -256,7 +374,7 @@ class BrowserManager:
                 text="",
                 text_clean=None,
                 text_markdown=None,
-                load_time=time.time() - start_time,
+                load_time=time.perf_counter() - start_time,
                 error=error_msg
             )
             
@@ -269,17 +387,18 @@ class BrowserManager:
                     
     def extract_links(self, html: str, base_url: str) -> List[str]:
         """Extract and normalize links from HTML."""
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
-        
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            # Convert relative URLs to absolute
-            full_url = urljoin(base_url, href)
-            
-            # Basic URL validation
-            parsed = urlparse(full_url)
-            if parsed.scheme in ['http', 'https'] and parsed.netloc:
-                links.append(full_url)
-                
-        return list(set(links))  # Remove duplicates
\ No newline at end of file
+        try:
+            tree = lxml.html.fromstring(html)
+        except ParserError:  # empty or whitespace-only document
+            return []
+
+        links = set()
+        for anchor in tree.iter('a'):
+            href = anchor.get('href')
+            if href:
+                # Convert relative URLs to absolute
+                full_url = urljoin(base_url, href.strip())
+                if _HTTP_URL_RE.match(full_url):
+                    links.add(full_url)
+
+        return list(links)
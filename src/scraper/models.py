@@ -1,8 +1,10 @@
 """Data models for the website scraper."""
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field, HttpUrl
+import pyarrow as pa
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 
 class ScrapingStatus(str, Enum):
@@ -28,11 +30,15 @@ class BrowserConfig(BaseModel):
     viewport_height: int = 1080
     timeout: int = 30000
     wait_for_load_state: str = "networkidle"
+    # CSS selector to wait for after load, for content rendered late by JS
+    wait_for_selector: Optional[str] = None
     block_resources: List[str] = Field(default_factory=lambda: ["image", "stylesheet", "font", "media"])
     # Security: Only disable sandbox in containerized environments (Docker/CI)
     disable_sandbox: bool = False
     # Maximum content size to accept (default 10MB)
     max_content_size: int = 10 * 1024 * 1024
+    # Produce text_markdown (a second trafilatura pass per page)
+    extract_markdown: bool = True
 
 
 class ScrapingRequest(BaseModel):
@@ -47,28 +53,34 @@ class ScrapingRequest(BaseModel):
     proxy_config: Optional[ProxyConfig] = None
 
 
-class ScrapedContent(BaseModel):
-    """Scraped content from a single page."""
+@dataclass(slots=True, kw_only=True)
+class ScrapedContent:
+    """Scraped content from a single page.
+
+    A plain dataclass rather than a pydantic model: one is built per page
+    from values the scraper already controls, so validation is skipped.
+    """
     url: str
     title: Optional[str] = None
     html: str
     text: str
     text_clean: Optional[str] = None  # Trafilatura-extracted clean text
     text_markdown: Optional[str] = None  # Markdown-formatted content
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    links: List[str] = Field(default_factory=list)
-    images: List[str] = Field(default_factory=list)
-    scraped_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    links: List[str] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+    scraped_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     load_time: float = 0.0
     status_code: Optional[int] = None
     error: Optional[str] = None
 
 
-class ScrapingResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ScrapingResult:
     """Complete scraping result for a website."""
     website_id: Optional[str] = None
     original_url: str
-    pages: List[ScrapedContent] = Field(default_factory=list)
+    pages: List[ScrapedContent] = field(default_factory=list)
     status: ScrapingStatus = ScrapingStatus.PENDING
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -93,14 +105,46 @@ class StorageConfig(BaseModel):
     # Cloud storage common
     bucket_name: Optional[str] = None
     partition_by_date: bool = True
-    compression: str = "gzip"
+    # zstd gives gzip-like ratios at several times the write speed on HTML;
+    # "lz4" trades some size for faster writes still
+    compression: str = "zstd"
+    compression_level: Optional[int] = None  # None: zstd level 3, codec default otherwise
     enable_fallback: bool = True  # Fallback to local storage if cloud fails
+    # Cloud save_pages uploads one pages.tar.gz instead of two objects per page
+    save_pages_batched: bool = True
+    # Fixed metadata_<key> columns (key -> Arrow type name, e.g. "string",
+    # "int64"); other keys go to metadata_json. None infers columns per result.
+    metadata_columns: Optional[Dict[str, str]] = None
+    # Parquet html/text columns; html is usually most of the file
+    store_html: bool = True
+    store_text: bool = True
+    # Pages per Parquet row group; None sizes groups from the average page size
+    row_group_pages: Optional[int] = Field(default=None, gt=0)
+    data_page_size: int = Field(default=1024 * 1024, gt=0)
 
     # AWS S3 configuration
     aws_credentials_file: Optional[str] = None  # Path to AWS credentials JSON file
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     aws_region: str = "us-east-1"
+    # Prefix S3 keys with a short hash of website_id to spread writes across
+    # partitions. Off by default: it moves objects to a different key layout
+    s3_hash_prefix: bool = False
 
     # GCP Storage configuration
-    gcs_credentials_file: Optional[str] = None  # Path to GCP service account JSON file
\ No newline at end of file
+    gcs_credentials_file: Optional[str] = None  # Path to GCP service account JSON file
+
+    @field_validator("metadata_columns")
+    @classmethod
+    def _check_metadata_column_types(
+        cls, value: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """Reject unknown Arrow type names here rather than at the first save."""
+        for key, dtype in (value or {}).items():
+            try:
+                pa.type_for_alias(dtype)
+            except ValueError:
+                raise ValueError(
+                    f"metadata_columns[{key!r}]: unknown Arrow type {dtype!r}"
+                ) from None
+        return value
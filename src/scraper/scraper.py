@@ -1,9 +1,17 @@
 """Main scraper implementation with async support."""
 import asyncio
 import logging
+import multiprocessing
+import os
+import random
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import List, Optional, Set, Dict, Any
+from typing import AsyncIterator, List, Optional, Set, Dict, Any, Tuple
 from urllib.parse import urljoin, urlparse
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from asyncio_throttle import Throttler
 
 from .models import (
@@ -23,6 +31,39 @@ logger = logging.getLogger(__name__)
 # Default limits
 DEFAULT_MAX_QUEUE_SIZE = 10000  # Maximum URLs to queue when following links
 DEFAULT_JOB_TIMEOUT = 3600  # 1 hour default job timeout in seconds
+DEFAULT_PER_HOST_CONCURRENT = 64  # Maximum in-flight pages per host
+DEFAULT_MAX_RETRIES = 3  # Retries for throttled/unavailable responses
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _read_url_column(file_path: str, url_column: str) -> List[str]:
+    """Read the non-empty values of one column from a CSV or Excel file.
+
+    CSVs are parsed with pyarrow, reading only the URL column.
+    """
+    if file_path.endswith('.csv'):
+        try:
+            table = pa_csv.read_csv(
+                file_path,
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[url_column],
+                    column_types={url_column: pa.string()},
+                    strings_can_be_null=True
+                )
+            )
+        except pa.ArrowKeyError as e:
+            raise ValueError(f"Column '{url_column}' not found in file") from e
+        return table.column(url_column).drop_null().to_pylist()
+
+    if file_path.endswith(('.xlsx', '.xls')):
+        import pandas as pd
+
+        df = pd.read_excel(file_path)
+        if url_column not in df.columns:
+            raise ValueError(f"Column '{url_column}' not found in file")
+        return df[url_column].dropna().tolist()
+
+    raise ValueError("Unsupported file format. Use CSV or Excel.")
 
 
 class WebsiteScraper:
@@ -34,7 +75,10 @@ class WebsiteScraper:
         requests_per_second: float = 1.0,
         storage_config: Optional[StorageConfig] = None,
         max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
-        job_timeout: Optional[float] = DEFAULT_JOB_TIMEOUT
+        job_timeout: Optional[float] = DEFAULT_JOB_TIMEOUT,
+        per_host_concurrent: int = DEFAULT_PER_HOST_CONCURRENT,
+        per_host_rps: Optional[Dict[str, float]] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES
     ):
         self.max_concurrent = max_concurrent
         self.throttler = Throttler(rate_limit=requests_per_second)
@@ -42,9 +86,97 @@ class WebsiteScraper:
         self.storage_backend = get_storage_backend(self.storage_config)
         self.max_queue_size = max_queue_size
         self.job_timeout = job_timeout
+        self.per_host_concurrent = per_host_concurrent
+        self.max_retries = max_retries
 
         # Semaphore for controlling concurrency
         self.semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Per-host limits, keyed by netloc, so one slow host can't take
+        # every slot when crawling many RIS hosts at once
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_concurrent)
+        )
+        self.host_throttlers: Dict[str, Throttler] = {
+            host: Throttler(rate_limit=rps) for host, rps in (per_host_rps or {}).items()
+        }
+
+        # Process pool for CPU-bound text extraction, created on first use
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+
+        # Started browsers shared across calls, keyed by launch settings
+        self._shared_browsers: Dict[Tuple, BrowserManager] = {}
+        self._shared_browser_lock = asyncio.Lock()
+
+    def _get_extract_pool(self) -> ProcessPoolExecutor:
+        """Return the trafilatura process pool, starting it if needed."""
+        if self._extract_pool is None:
+            # spawn: forking a process that hosts Playwright's threads is unsafe
+            self._extract_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._extract_pool
+
+    def _browser(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        proxy_config: Optional[ProxyConfig] = None
+    ) -> BrowserManager:
+        """Create a browser manager that extracts text on the process pool."""
+        return BrowserManager(browser_config, proxy_config, self._get_extract_pool())
+
+    @staticmethod
+    def _launch_key(
+        browser_config: BrowserConfig,
+        proxy_config: Optional[ProxyConfig]
+    ) -> Tuple:
+        """Settings fixed when a browser and its context are created."""
+        return (
+            browser_config.headless,
+            browser_config.disable_sandbox,
+            browser_config.user_agent,
+            browser_config.viewport_width,
+            browser_config.viewport_height,
+            tuple(browser_config.block_resources),
+            (proxy_config.server, proxy_config.username, proxy_config.password)
+            if proxy_config else None
+        )
+
+    async def _shared_browser(
+        self,
+        browser_config: BrowserConfig,
+        proxy_config: Optional[ProxyConfig] = None
+    ) -> BrowserManager:
+        """Return a started browser for these launch settings, reusing it.
+
+        Chromium is launched once per distinct launch configuration and
+        kept until aclose(); each scrape only opens and closes a page.
+        """
+        key = self._launch_key(browser_config, proxy_config)
+        async with self._shared_browser_lock:
+            browser = self._shared_browsers.get(key)
+            if browser is None:
+                browser = self._browser(browser_config, proxy_config)
+                await browser.start()
+                self._shared_browsers[key] = browser
+        return browser
+
+    async def aclose(self) -> None:
+        """Close shared browsers, the extraction process pool and the storage backend."""
+        browsers, self._shared_browsers = list(self._shared_browsers.values()), {}
+        for browser in browsers:
+            await browser.close()
+        if self._extract_pool is not None:
+            pool, self._extract_pool = self._extract_pool, None
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+        await self.storage_backend.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
         
     async def scrape_single_url(
         self, 
@@ -53,11 +185,46 @@ class WebsiteScraper:
         proxy_config: Optional[ProxyConfig] = None,
         custom_selectors: Optional[Dict[str, str]] = None
     ) -> ScrapedContent:
-        """Scrape a single URL."""
-        async with self.semaphore:
-            async with self.throttler:
-                async with BrowserManager(browser_config, proxy_config) as browser:
-                    return await browser.scrape_page(url, custom_selectors)
+        """Scrape a single URL on the scraper's shared browser."""
+        browser_config = browser_config or BrowserConfig()
+        browser = await self._shared_browser(browser_config, proxy_config)
+        return await self._scrape_with(browser, url, custom_selectors, browser_config)
+
+    async def _scrape_with(
+        self,
+        browser: BrowserManager,
+        url: str,
+        custom_selectors: Optional[Dict[str, str]] = None,
+        browser_config: Optional[BrowserConfig] = None
+    ) -> ScrapedContent:
+        """Scrape a URL on an already started browser, honouring limits.
+
+        Responses with a retryable status (429/5xx) are retried with
+        exponential backoff and jitter.
+        """
+        host = urlparse(url).netloc
+        host_throttler = self.host_throttlers.get(host)
+
+        attempt = 0
+        while True:
+            async with self.semaphore, self.host_semaphores[host]:
+                async with self.throttler:
+                    if host_throttler:
+                        async with host_throttler:
+                            content = await browser.scrape_page(url, custom_selectors, browser_config)
+                    else:
+                        content = await browser.scrape_page(url, custom_selectors, browser_config)
+
+            if content.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return content
+
+            delay = 2 ** attempt + random.random()
+            logger.warning(
+                f"HTTP {content.status_code} from {url}, retrying in {delay:.1f}s "
+                f"({attempt + 1}/{self.max_retries})"
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
                     
     async def scrape_website(self, request: ScrapingRequest) -> ScrapingResult:
         """Scrape a complete website based on the request."""
@@ -72,56 +239,78 @@ class WebsiteScraper:
             """Inner scraping logic wrapped for timeout."""
             nonlocal result
 
-            # Start with the main URL
-            urls_to_scrape = [str(request.url)]
-            scraped_urls: Set[str] = set()
+            # Frontier of URLs to visit, drained by max_concurrent workers
+            queue: asyncio.Queue = asyncio.Queue()
+            queue.put_nowait(str(request.url))
+            queued_urls: Set[str] = {str(request.url)}  # O(1) frontier membership
             all_pages: List[ScrapedContent] = []
+            pages_started = 0
 
-            # Get domain for link filtering
+            # Same-host check for discovered links, compiled once per crawl
             domain = urlparse(str(request.url)).netloc
+            same_domain_re = re.compile(rf'https?://{re.escape(domain)}(?:[/?#]|$)', re.IGNORECASE)
+
+            async def worker(browser: BrowserManager) -> None:
+                nonlocal pages_started
+                while True:
+                    current_url = await queue.get()
+                    try:
+                        if pages_started >= request.max_pages:
+                            continue
+                        pages_started += 1
+
+                        logger.info(f"Scraping: {current_url}")
+                        page_content = await self._scrape_with(
+                            browser, current_url, request.custom_selectors, request.browser_config
+                        )
+                        all_pages.append(page_content)
+
+                        # If following links and haven't reached max pages
+                        if (request.follow_links and
+                            pages_started < request.max_pages and
+                            page_content.html and
+                            not page_content.error):
 
-            async with BrowserManager(request.browser_config, request.proxy_config) as browser:
-                for current_url in urls_to_scrape[:request.max_pages]:
-                    if current_url in scraped_urls:
-                        continue
-
-                    logger.info(f"Scraping: {current_url}")
-
-                    async with self.semaphore:
-                        async with self.throttler:
-                            page_content = await browser.scrape_page(
-                                current_url,
-                                request.custom_selectors
-                            )
-
-                    scraped_urls.add(current_url)
-                    all_pages.append(page_content)
-
-                    # If following links and haven't reached max pages
-                    if (request.follow_links and
-                        len(scraped_urls) < request.max_pages and
-                        page_content.html and
-                        not page_content.error):
-
-                        # Extract and filter links
-                        page_links = browser.extract_links(page_content.html, current_url)
-                        same_domain_links = [
-                            link for link in page_links
-                            if urlparse(link).netloc == domain and link not in scraped_urls
-                        ]
-
-                        # Add new links to scrape queue with queue size limit
-                        for link in same_domain_links[:5]:  # Limit new links per page
-                            if link not in urls_to_scrape:
-                                if len(urls_to_scrape) >= self.max_queue_size:
+                            # Extract and filter links
+                            page_links = browser.extract_links(page_content.html, current_url)
+                            same_domain_links = [
+                                link for link in page_links
+                                if same_domain_re.match(link) and link not in queued_urls
+                            ]
+
+                            # Add new links to scrape queue with queue size limit
+                            for link in same_domain_links[:5]:  # Limit new links per page
+                                if len(queued_urls) >= self.max_queue_size:
                                     logger.warning(
                                         f"URL queue limit reached ({self.max_queue_size}), "
                                         f"not adding more URLs"
                                     )
                                     break
-                                urls_to_scrape.append(link)
+                                queue.put_nowait(link)
+                                queued_urls.add(link)
+
+                            logger.info(f"Found {len(same_domain_links)} same-domain links")
+                    finally:
+                        queue.task_done()
 
-                        logger.info(f"Found {len(same_domain_links)} same-domain links")
+            browser = await self._shared_browser(
+                request.browser_config or BrowserConfig(), request.proxy_config
+            )
+            workers = [
+                asyncio.create_task(worker(browser))
+                for _ in range(self.max_concurrent)
+            ]
+            drained = asyncio.create_task(queue.join())
+            try:
+                # Workers only finish early by raising
+                await asyncio.wait([drained, *workers], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in (drained, *workers):
+                    task.cancel()
+                outcomes = await asyncio.gather(drained, *workers, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    raise outcome
 
             # Update result
             result.pages = all_pages
@@ -167,33 +356,71 @@ class WebsiteScraper:
         proxy_config: Optional[ProxyConfig] = None,
         custom_selectors: Optional[Dict[str, str]] = None
     ) -> List[ScrapedContent]:
-        """Scrape multiple URLs concurrently."""
-        
-        async def scrape_single(url: str) -> ScrapedContent:
-            return await self.scrape_single_url(url, browser_config, proxy_config, custom_selectors)
-        
-        # Create tasks for all URLs
-        tasks = [scrape_single(url) for url in urls]
-        
-        # Execute with progress logging
+        """Scrape multiple URLs concurrently.
+
+        All URLs share one browser instance; each URL gets its own page.
+        """
         results = []
+
+        async for result in self.scrape_as_completed(
+            urls, browser_config, proxy_config, custom_selectors
+        ):
+            results.append(result)
+
+        logger.info(f"Finished scraping {len(results)} URLs")
+        return results
+
+    async def scrape_as_completed(
+        self,
+        urls: List[str],
+        browser_config: Optional[BrowserConfig] = None,
+        proxy_config: Optional[ProxyConfig] = None,
+        custom_selectors: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[ScrapedContent]:
+        """Scrape URLs concurrently on one browser, yielding pages as they finish.
+
+        A pool of max_concurrent workers pulls URLs from a shared iterator,
+        so only that many scrapes exist at once however long the URL list.
+        Closing the iterator early (e.g. breaking out of ``async for``)
+        cancels the scrapes still in flight.
+        """
         completed = 0
-        
-        for coro in asyncio.as_completed(tasks):
-            try:
-                result = await coro
-                results.append(result)
+        browser_config = browser_config or BrowserConfig()
+        browser = await self._shared_browser(browser_config, proxy_config)
+
+        pending_urls = iter(urls)
+        # Bounded so workers pause while the consumer is busy
+        finished: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent)
+
+        async def worker() -> None:
+            # Every URL puts exactly one item, None when scraping raised
+            for url in pending_urls:
+                try:
+                    result = await self._scrape_with(browser, url, custom_selectors, browser_config)
+                except Exception as e:
+                    logger.error(f"Failed to scrape URL: {e}")
+                    result = None
+                await finished.put(result)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrent, len(urls)))
+        ]
+        try:
+            for _ in range(len(urls)):
+                result = await finished.get()
                 completed += 1
-                
+
                 if completed % 10 == 0:
                     logger.info(f"Completed {completed}/{len(urls)} URLs")
-                    
-            except Exception as e:
-                logger.error(f"Failed to scrape URL: {e}")
-                completed += 1
-                
-        logger.info(f"Finished scraping {len(results)} URLs")
-        return results
+
+                if result is not None:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            # Let cancelled pages close before returning
+            await asyncio.gather(*workers, return_exceptions=True)
         
     async def scrape_from_file(
         self,
@@ -204,43 +431,65 @@ class WebsiteScraper:
         **scrape_kwargs
     ) -> str:
         """Scrape URLs from a CSV/Excel file."""
-        import pandas as pd
-        
-        # Read the file
-        if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path)
-        elif file_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file_path)
-        else:
-            raise ValueError("Unsupported file format. Use CSV or Excel.")
-            
-        if url_column not in df.columns:
-            raise ValueError(f"Column '{url_column}' not found in file")
-            
-        urls = df[url_column].dropna().tolist()
+        # Parsing a large file would otherwise stall the event loop
+        urls = await asyncio.to_thread(_read_url_column, file_path, url_column)
         logger.info(f"Found {len(urls)} URLs to scrape")
         
-        # Process in batches
-        all_results = []
-        for i in range(0, len(urls), batch_size):
-            batch_urls = urls[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(urls) + batch_size - 1)//batch_size}")
-            
-            batch_results = await self.scrape_multiple_urls(batch_urls, **scrape_kwargs)
-            all_results.extend(batch_results)
-            
-            # Optional: save intermediate results
-            if len(all_results) >= batch_size * 2:
-                await self._save_batch_results(all_results, f"batch_{i//batch_size}")
-                all_results = []
-                
-        # Save final results
-        if all_results:
-            storage_path = await self._save_batch_results(all_results, "final")
-            return storage_path
-            
-        return "completed"
-        
+        # Results stream through a bounded queue to a writer task that saves
+        # every batch_size pages, so at most ~2 batches are held in memory
+        results: asyncio.Queue = asyncio.Queue(maxsize=batch_size)
+        writer = asyncio.create_task(self._storage_writer(results, batch_size))
+        try:
+            for i in range(0, len(urls), batch_size):
+                batch_urls = urls[i:i + batch_size]
+                logger.info(f"Processing batch {i//batch_size + 1}/{(len(urls) + batch_size - 1)//batch_size}")
+
+                async for content in self.scrape_as_completed(batch_urls, **scrape_kwargs):
+                    await self._put_unless_done(results, content, writer)
+
+            await self._put_unless_done(results, None, writer)
+            storage_path = await writer
+        finally:
+            if not writer.done():
+                writer.cancel()
+                await asyncio.gather(writer, return_exceptions=True)
+
+        return storage_path or "completed"
+
+    @staticmethod
+    async def _put_unless_done(queue: asyncio.Queue, item: Any, consumer: asyncio.Task) -> None:
+        """Put an item on a bounded queue, surfacing the consumer's failure.
+
+        Without this a producer would wait forever on a full queue whose
+        consumer has died.
+        """
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait([put, consumer], return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            await consumer  # raises the consumer's exception
+            raise RuntimeError("Storage writer stopped before all results were saved")
+
+    async def _storage_writer(self, results: asyncio.Queue, batch_size: int) -> Optional[str]:
+        """Save queued pages in batches until a None sentinel arrives.
+
+        Returns:
+            Storage path of the last saved batch, or None if nothing was saved
+        """
+        batch: List[ScrapedContent] = []
+        storage_path = None
+        batch_number = 0
+        while (content := await results.get()) is not None:
+            batch.append(content)
+            if len(batch) >= batch_size:
+                storage_path = await self._save_batch_results(batch, f"batch_{batch_number}")
+                batch_number += 1
+                batch = []
+
+        if batch:
+            storage_path = await self._save_batch_results(batch, "final")
+        return storage_path
+
     async def _save_batch_results(self, results: List[ScrapedContent], batch_name: str) -> str:
         """Save a batch of results."""
         # Create a mock scraping result for storage
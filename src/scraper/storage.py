@@ -1,22 +1,340 @@
 """Storage backends for scraped data."""
 import asyncio
+import functools
+import hashlib
+import io
 import json
 import logging
+import operator
 import os
-import tempfile
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-import polars as pl
-import aiofiles
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .models import ScrapingResult, ScrapedContent, StorageConfig
 
 logger = logging.getLogger(__name__)
 
+# Page uploads in flight per cloud backend
+UPLOAD_CONCURRENCY = 32
+
+# S3 multipart settings: large parquet dumps upload in parallel parts
+S3_MULTIPART_THRESHOLD = 25 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE = 32 * 1024 * 1024
+S3_MAX_CONCURRENCY = 16
+# botocore defaults to 10 pooled connections, fewer than one multipart
+# upload's parts plus concurrent page puts would use
+S3_MAX_POOL_CONNECTIONS = 64
+
+
+# Pages per Parquet row group, sized so a group holds about
+# ROW_GROUP_TARGET_BYTES of html/text; also bounds the Arrow copy held
+# while writing
+ROW_GROUP_TARGET_BYTES = 64 * 1024 * 1024
+MIN_ROW_GROUP_PAGES = 64
+MAX_ROW_GROUP_PAGES = 8192
+DATA_PAGE_SIZE = 1024 * 1024
+
+# Fixed per-page columns, built once at import; html/text are large_string
+# so a row group can hold more than 2 GiB of markup
+PAGE_SCHEMA = pa.schema([
+    ("website_id", pa.string()),
+    ("original_url", pa.string()),
+    ("page_url", pa.string()),
+    ("title", pa.string()),
+    ("html", pa.large_string()),
+    ("text", pa.large_string()),
+    ("scraped_at", pa.timestamp("us", tz="UTC")),
+    ("load_time", pa.float64()),
+    ("status_code", pa.int64()),
+    ("error", pa.string()),
+    ("link_count", pa.int64()),
+    ("image_count", pa.int64()),
+    ("content_length", pa.int64()),
+    ("text_length", pa.int64()),
+])
+
+# Columns whose values repeat within a file. Unique-per-page columns
+# (page_url, html, text) are left plain: a dictionary there only costs time.
+DICTIONARY_COLUMNS = ["website_id", "original_url", "title", "status_code", "error"]
+
+# StorageConfig codec names that pyarrow spells differently
+_PARQUET_CODECS = {"uncompressed": "none"}
+# Codecs that take a compression level
+_LEVELED_CODECS = frozenset({"gzip", "brotli", "zstd"})
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def _metadata_columns(pages: List[ScrapedContent]) -> List[Tuple[str, pa.DataType]]:
+    """Metadata keys in first-seen order, typed from all pages' values."""
+    keys = dict.fromkeys(key for page in pages for key in page.metadata)
+    return [
+        (key, pa.array([page.metadata.get(key) for page in pages]).type)
+        for key in keys
+    ]
+
+
+def _declared_metadata_columns(
+    metadata_columns: Dict[str, str]
+) -> List[Tuple[str, pa.DataType]]:
+    """Configured metadata keys with their Arrow types ("string", "int64", ...)."""
+    return [(key, pa.type_for_alias(dtype)) for key, dtype in metadata_columns.items()]
+
+
+def _extra_metadata_json(page: ScrapedContent, declared: Dict[str, str]) -> Optional[str]:
+    """JSON object of the metadata keys not declared as columns, None if none."""
+    extra = {key: value for key, value in page.metadata.items() if key not in declared}
+    return json.dumps(extra, default=str) if extra else None
+
+
+# Per-page fields read by _page_batch, in column order
+_PAGE_FIELDS = operator.attrgetter(
+    "url", "title", "html", "text", "scraped_at", "load_time",
+    "status_code", "error", "links", "images"
+)
+
+
+def _page_batch(
+    result: ScrapingResult,
+    pages: List[ScrapedContent],
+    schema: pa.Schema,
+    metadata_keys: List[str],
+    declared: Optional[Dict[str, str]] = None
+) -> pa.RecordBatch:
+    """One record batch for a slice of pages, built column by column."""
+    def column(name: str, values: Sequence[Any]) -> pa.Array:
+        return pa.array(values, type=schema.field(name).type)
+
+    def char_counts(array: Optional[pa.Array], contents: Sequence[str]) -> pa.Array:
+        # Counted over the Arrow buffer in one pass when the column is stored
+        if array is not None:
+            return pc.utf8_length(array)
+        return pa.array(list(map(len, contents)), type=pa.int64())
+
+    # One C-level pass splits the pages into per-field tuples
+    (urls, titles, html, text, scraped_at, load_times, status_codes, errors, links, images) = zip(
+        *map(_PAGE_FIELDS, pages)
+    )
+    html_array = column("html", html) if "html" in schema.names else None
+    text_array = column("text", text) if "text" in schema.names else None
+    arrays = [
+        # Per-result constants are repeated on the Arrow side, not as Python lists
+        pa.repeat(pa.scalar(result.website_id, type=pa.string()), len(pages)),
+        pa.repeat(pa.scalar(result.original_url, type=pa.string()), len(pages)),
+        column("page_url", urls),
+        column("title", titles),
+        html_array,
+        text_array,
+        column("scraped_at", scraped_at),
+        column("load_time", load_times),
+        column("status_code", status_codes),
+        column("error", errors),
+        column("link_count", list(map(len, links))),
+        column("image_count", list(map(len, images))),
+        char_counts(html_array, html),
+        char_counts(text_array, text),
+    ]
+    # Dropped html/text columns leave a None slot
+    arrays = [array for array in arrays if array is not None]
+    # Add metadata as separate columns
+    arrays.extend(
+        column(f"metadata_{key}", [page.metadata.get(key) for page in pages])
+        for key in metadata_keys
+    )
+    if declared is not None:
+        extra = [_extra_metadata_json(page, declared) for page in pages]
+        arrays.append(column("metadata_json", extra))
+    return pa.record_batch(arrays, schema=schema)
+
+
+def _row_group_pages(
+    pages: List[ScrapedContent],
+    store_html: bool = True,
+    store_text: bool = True
+) -> int:
+    """Pages per row group for about ROW_GROUP_TARGET_BYTES of stored content."""
+    stored = sum(
+        (len(page.html) if store_html else 0) + (len(page.text) if store_text else 0)
+        for page in pages
+    )
+    average = max(1, stored // max(1, len(pages)))
+    return max(MIN_ROW_GROUP_PAGES, min(MAX_ROW_GROUP_PAGES, ROW_GROUP_TARGET_BYTES // average))
+
+
+def write_result_parquet(
+    result: ScrapingResult,
+    path: Union[str, Path],
+    compression: str = "zstd",
+    compression_level: Optional[int] = None,
+    batch_pages: Optional[int] = None,
+    data_page_size: int = DATA_PAGE_SIZE,
+    declared_metadata: Optional[Dict[str, str]] = None,
+    store_html: bool = True,
+    store_text: bool = True
+) -> None:
+    """Stream a scraping result to Parquet, one row group per page batch.
+
+    The schema is fixed up front: the page columns plus a
+    ``metadata_<key>`` column per metadata key, None where a page lacks
+    the key. With ``declared_metadata`` (key -> Arrow type name) the
+    metadata columns are exactly those keys, dictionary-encoded, and any
+    other keys go into a ``metadata_json`` column, so every file written
+    with the same declaration has the same schema. Otherwise the keys are
+    inferred from the pages.
+
+    ``store_html=False`` / ``store_text=False`` leave out the html / text
+    columns (content_length and text_length are still written), so files
+    written with different flags have different schemas.
+
+    ``batch_pages`` (pages per row group) defaults to _row_group_pages():
+    many small pages share a group, few large ones are split up.
+    """
+    if declared_metadata is not None:
+        metadata_columns = _declared_metadata_columns(declared_metadata)
+    else:
+        metadata_columns = _metadata_columns(result.pages)
+    schema = PAGE_SCHEMA
+    if not store_html:
+        schema = schema.remove(schema.get_field_index("html"))
+    if not store_text:
+        schema = schema.remove(schema.get_field_index("text"))
+    for key, dtype in metadata_columns:
+        schema = schema.append(pa.field(f"metadata_{key}", dtype))
+    use_dictionary = DICTIONARY_COLUMNS
+    if declared_metadata is not None:
+        schema = schema.append(pa.field("metadata_json", pa.large_string()))
+        use_dictionary = DICTIONARY_COLUMNS + [f"metadata_{key}" for key in declared_metadata]
+    # Readers can take the per-result constants from the footer
+    schema = schema.with_metadata({
+        "website_id": result.website_id or "",
+        "original_url": result.original_url,
+    })
+    metadata_keys = [key for key, _ in metadata_columns]
+
+    if batch_pages is None:
+        batch_pages = _row_group_pages(result.pages, store_html, store_text)
+
+    codec = _PARQUET_CODECS.get(compression.lower(), compression.lower())
+    if compression_level is None and codec == "zstd":
+        compression_level = DEFAULT_ZSTD_LEVEL
+    if codec not in _LEVELED_CODECS:
+        compression_level = None
+
+    with pq.ParquetWriter(
+        path,
+        schema,
+        compression=codec,
+        compression_level=compression_level,
+        use_dictionary=use_dictionary,
+        data_page_size=data_page_size
+    ) as writer:
+        for start in range(0, len(result.pages), batch_pages):
+            pages = result.pages[start:start + batch_pages]
+            writer.write_batch(
+                _page_batch(result, pages, schema, metadata_keys, declared_metadata)
+            )
+
+
+def _parquet_options(config: StorageConfig) -> Dict[str, Any]:
+    """write_result_parquet keyword arguments taken from a storage config."""
+    return {
+        "compression": config.compression,
+        "compression_level": config.compression_level,
+        "batch_pages": config.row_group_pages,
+        "data_page_size": config.data_page_size,
+        "declared_metadata": config.metadata_columns,
+        "store_html": config.store_html,
+        "store_text": config.store_text,
+    }
+
+
+def pages_archive(pages: List[ScrapedContent]) -> bytes:
+    """Pack pages into a gzipped tar of page_NNN.html / page_NNN.txt members."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for i, page in enumerate(pages):
+            for suffix, content in (("html", page.html), ("txt", page.text)):
+                data = content.encode("utf-8")
+                info = tarfile.TarInfo(f"page_{i:03d}.{suffix}")
+                info.size = len(data)
+                info.mtime = int(page.scraped_at.timestamp())
+                archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def _write_page_files(base_path: Path, pages: List[ScrapedContent]) -> None:
+    """Write page_NNN.html and page_NNN.txt for each page (blocking)."""
+    for i, page in enumerate(pages):
+        (base_path / f"page_{i:03d}.html").write_text(page.html, encoding='utf-8')
+        (base_path / f"page_{i:03d}.txt").write_text(page.text, encoding='utf-8')
+
+
+def _file_version(path: Optional[str]) -> Optional[int]:
+    """Modification time of a credentials file, so an edited file misses the client cache."""
+    return os.stat(path).st_mtime_ns if path else None
+
+
+# Clients are built once per credential set: construction parses the
+# credentials and sets up connection pools and signers, and both clients
+# are safe to share between backends and threads.
+@functools.lru_cache(maxsize=8)
+def _gcs_client(credentials_file: Optional[str], file_version: Optional[int]) -> storage.Client:
+    """Cached GCS client for a service account file (or default credentials)."""
+    # Default transport: storage.Client has no public hook for a custom session
+    if credentials_file:
+        return storage.Client.from_service_account_json(credentials_file)
+    # Fall back to default credentials (environment variables, etc.)
+    return storage.Client()
+
+
+@functools.lru_cache(maxsize=8)
+def _s3_client(
+    credentials_file: Optional[str],
+    file_version: Optional[int],
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    region: str
+) -> Any:
+    """Cached S3 client for a credentials file, key pair, or the default chain."""
+    # Initialize S3 client with credentials file priority
+    session_kwargs = {}
+    if credentials_file:
+        # Load credentials from JSON file
+        with open(credentials_file, 'r') as f:
+            creds = json.load(f)
+            session_kwargs['aws_access_key_id'] = creds.get('aws_access_key_id')
+            session_kwargs['aws_secret_access_key'] = creds.get('aws_secret_access_key')
+            session_kwargs['region_name'] = creds.get('region', region)
+    elif access_key_id and secret_access_key:
+        # Use credentials from config
+        session_kwargs['aws_access_key_id'] = access_key_id
+        session_kwargs['aws_secret_access_key'] = secret_access_key
+        session_kwargs['region_name'] = region
+    else:
+        # Fall back to default credentials (environment variables, ~/.aws/credentials, etc.)
+        session_kwargs['region_name'] = region
+
+    return boto3.client(
+        's3',
+        config=BotoConfig(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            tcp_keepalive=True
+        ),
+        **session_kwargs
+    )
+
 
 class StorageBackend:
     """Base class for storage backends."""
@@ -29,6 +347,15 @@ class StorageBackend:
         """Save individual pages and return storage path."""
         raise NotImplementedError
 
+    async def aclose(self) -> None:
+        """Release resources held by the backend."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
 
 class LocalStorageBackend(StorageBackend):
     """Local file system storage backend."""
@@ -38,17 +365,24 @@ class LocalStorageBackend(StorageBackend):
         self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-    def _get_file_path(self, website_id: str, file_type: str = "parquet") -> Path:
+    def _get_file_path(
+        self,
+        website_id: str,
+        file_type: str = "parquet",
+        now: Optional[datetime] = None
+    ) -> Path:
         """Get file path for storing data."""
+        # One clock read, so the date partition and timestamp always agree
+        now = now or datetime.now(timezone.utc)
         if self.config.partition_by_date:
-            date_str = datetime.now(timezone.utc).strftime("%Y_%m_%d")
+            date_str = now.strftime("%Y_%m_%d")
             file_dir = self.output_dir / date_str
         else:
             file_dir = self.output_dir
 
         file_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{website_id}_{timestamp}.{file_type}"
 
         return file_dir / filename
@@ -59,39 +393,8 @@ class LocalStorageBackend(StorageBackend):
             website_id = result.website_id or "unknown"
             file_path = self._get_file_path(website_id)
 
-            # Convert to Polars DataFrame
-            df_data = []
-            for page in result.pages:
-                row = {
-                    "website_id": result.website_id,
-                    "original_url": result.original_url,
-                    "page_url": page.url,
-                    "title": page.title,
-                    "html": page.html,
-                    "text": page.text,
-                    "scraped_at": page.scraped_at,
-                    "load_time": page.load_time,
-                    "status_code": page.status_code,
-                    "error": page.error,
-                    "link_count": len(page.links),
-                    "image_count": len(page.images),
-                    "content_length": len(page.html),
-                    "text_length": len(page.text)
-                }
-
-                # Add metadata as separate columns
-                for key, value in page.metadata.items():
-                    row[f"metadata_{key}"] = value
-
-                df_data.append(row)
-
-            df = pl.DataFrame(df_data)
-
             # Save as parquet
-            df.write_parquet(
-                file_path,
-                compression=self.config.compression
-            )
+            write_result_parquet(result, file_path, **_parquet_options(self.config))
 
             logger.info(f"Saved scraping result to {file_path}")
             return str(file_path)
@@ -106,19 +409,8 @@ class LocalStorageBackend(StorageBackend):
             base_path = self._get_file_path(website_id).parent / website_id
             base_path.mkdir(parents=True, exist_ok=True)
             
-            saved_files = []
-            for i, page in enumerate(pages):
-                # Save HTML
-                html_file = base_path / f"page_{i:03d}.html"
-                async with aiofiles.open(html_file, 'w', encoding='utf-8') as f:
-                    await f.write(page.html)
-                    
-                # Save text
-                text_file = base_path / f"page_{i:03d}.txt"
-                async with aiofiles.open(text_file, 'w', encoding='utf-8') as f:
-                    await f.write(page.text)
-                    
-                saved_files.extend([str(html_file), str(text_file)])
+            # All files in one thread hop rather than one per open/write
+            await asyncio.to_thread(_write_page_files, base_path, pages)
                 
             logger.info(f"Saved {len(pages)} pages to {base_path}")
             return str(base_path)
@@ -136,24 +428,35 @@ class CloudStorageBackend(StorageBackend):
         if not config.bucket_name:
             raise ValueError("bucket_name is required for cloud storage")
 
-        # Initialize client with credentials file priority
-        if config.gcs_credentials_file:
-            self.client = storage.Client.from_service_account_json(config.gcs_credentials_file)
-        else:
-            # Fall back to default credentials (environment variables, etc.)
-            self.client = storage.Client()
+        self.client = _gcs_client(
+            config.gcs_credentials_file, _file_version(config.gcs_credentials_file)
+        )
 
         self.bucket = self.client.bucket(config.bucket_name)
+        self.upload_executor = ThreadPoolExecutor(
+            max_workers=UPLOAD_CONCURRENCY, thread_name_prefix="gcs-upload"
+        )
+
+    async def aclose(self) -> None:
+        """Shut down the upload thread pool once in-flight uploads finish."""
+        await asyncio.to_thread(self.upload_executor.shutdown)
         
-    def _get_blob_path(self, website_id: str, file_type: str = "parquet") -> str:
+    def _get_blob_path(
+        self,
+        website_id: str,
+        file_type: str = "parquet",
+        now: Optional[datetime] = None
+    ) -> str:
         """Get blob path for storing data."""
+        # One clock read, so the date partition and timestamp always agree
+        now = now or datetime.now(timezone.utc)
         if self.config.partition_by_date:
-            date_str = datetime.now(timezone.utc).strftime("%Y_%m_%d")
+            date_str = now.strftime("%Y_%m_%d")
             path_prefix = f"data/{date_str}"
         else:
             path_prefix = "data"
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{website_id}_{timestamp}.{file_type}"
 
         return f"{path_prefix}/{filename}"
@@ -164,56 +467,24 @@ class CloudStorageBackend(StorageBackend):
             website_id = result.website_id or "unknown"
             blob_path = self._get_blob_path(website_id)
 
-            # Convert to Polars DataFrame
-            df_data = []
-            for page in result.pages:
-                row = {
-                    "website_id": result.website_id,
-                    "original_url": result.original_url,
-                    "page_url": page.url,
-                    "title": page.title,
-                    "html": page.html,
-                    "text": page.text,
-                    "scraped_at": page.scraped_at,
-                    "load_time": page.load_time,
-                    "status_code": page.status_code,
-                    "error": page.error,
-                    "link_count": len(page.links),
-                    "image_count": len(page.images),
-                    "content_length": len(page.html),
-                    "text_length": len(page.text)
-                }
-
-                # Add metadata as separate columns
-                for key, value in page.metadata.items():
-                    row[f"metadata_{key}"] = value
-
-                df_data.append(row)
-
-            df = pl.DataFrame(df_data)
-
-            # Save to secure temporary file
-            fd, temp_file = tempfile.mkstemp(suffix='.parquet', prefix=f'{website_id}_')
-            try:
-                os.close(fd)  # Close the file descriptor, we'll write via polars
-                df.write_parquet(
-                    temp_file,
-                    compression=self.config.compression
-                )
+            # Serialize in memory; the bytes go straight to the upload
+            buffer = io.BytesIO()
+            write_result_parquet(result, buffer, **_parquet_options(self.config))
+            buffer.seek(0)
 
-                # Upload to cloud storage
-                def _upload():
-                    blob = self.bucket.blob(blob_path)
-                    blob.upload_from_filename(temp_file)
+            # Upload to cloud storage
+            def _upload():
+                blob = self.bucket.blob(blob_path)
+                blob.upload_from_file(
+                    buffer,
+                    size=buffer.getbuffer().nbytes,
+                    content_type="application/octet-stream"
+                )
 
-                await asyncio.get_event_loop().run_in_executor(None, _upload)
+            await asyncio.get_event_loop().run_in_executor(None, _upload)
 
-                logger.info(f"Saved scraping result to gs://{self.config.bucket_name}/{blob_path}")
-                return f"gs://{self.config.bucket_name}/{blob_path}"
-            finally:
-                # Always clean up temp file, even on failure
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+            logger.info(f"Saved scraping result to gs://{self.config.bucket_name}/{blob_path}")
+            return f"gs://{self.config.bucket_name}/{blob_path}"
 
         except Exception as e:
             logger.error(f"Failed to save result to cloud storage: {e}")
@@ -226,35 +497,36 @@ class CloudStorageBackend(StorageBackend):
             if self.config.partition_by_date:
                 date_str = datetime.now(timezone.utc).strftime("%Y/%m/%d")
                 base_path = f"{base_path}/{date_str}"
-                
-            saved_files = []
-            
-            def _upload_content(content: str, blob_path: str):
-                blob = self.bucket.blob(blob_path)
-                blob.upload_from_string(content, content_type='text/html')
-                
-            # Upload all pages concurrently
-            upload_tasks = []
-            for i, page in enumerate(pages):
-                # HTML file
-                html_path = f"{base_path}/page_{i:03d}.html"
-                upload_tasks.append(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, _upload_content, page.html, html_path
-                    )
-                )
-                
-                # Text file
-                text_path = f"{base_path}/page_{i:03d}.txt"
-                upload_tasks.append(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, _upload_content, page.text, text_path
+
+            if self.config.save_pages_batched:
+                # One object per call: a single PUT instead of two per page
+                archive_path = f"{base_path}/pages.tar.gz"
+
+                def _upload_archive():
+                    self.bucket.blob(archive_path).upload_from_string(
+                        pages_archive(pages), content_type='application/gzip'
                     )
-                )
-                
-                saved_files.extend([html_path, text_path])
+
+                await asyncio.get_running_loop().run_in_executor(self.upload_executor, _upload_archive)
+                logger.info(f"Saved {len(pages)} pages to gs://{self.config.bucket_name}/{archive_path}")
+                return f"gs://{self.config.bucket_name}/{archive_path}"
                 
-            await asyncio.gather(*upload_tasks)
+            # Upload all pages through the transfer manager's thread pool,
+            # UPLOAD_CONCURRENCY at a time over the shared HTTP session
+            file_blob_pairs = []
+            for i, page in enumerate(pages):
+                for suffix, content in (("html", page.html), ("txt", page.text)):
+                    blob = self.bucket.blob(f"{base_path}/page_{i:03d}.{suffix}")
+                    blob.content_type = 'text/html'
+                    file_blob_pairs.append((io.BytesIO(content.encode('utf-8')), blob))
+
+            await asyncio.to_thread(
+                transfer_manager.upload_many,
+                file_blob_pairs,
+                raise_exception=True,
+                worker_type=transfer_manager.THREAD,
+                max_workers=UPLOAD_CONCURRENCY
+            )
             
             logger.info(f"Saved {len(pages)} pages to gs://{self.config.bucket_name}/{base_path}")
             return f"gs://{self.config.bucket_name}/{base_path}"
@@ -272,95 +544,98 @@ class S3StorageBackend(StorageBackend):
         if not config.bucket_name:
             raise ValueError("bucket_name is required for S3 storage")
 
-        # Initialize S3 client with credentials file priority
-        session_kwargs = {}
-        if config.aws_credentials_file:
-            # Load credentials from JSON file
-            with open(config.aws_credentials_file, 'r') as f:
-                creds = json.load(f)
-                session_kwargs['aws_access_key_id'] = creds.get('aws_access_key_id')
-                session_kwargs['aws_secret_access_key'] = creds.get('aws_secret_access_key')
-                session_kwargs['region_name'] = creds.get('region', config.aws_region)
-        elif config.aws_access_key_id and config.aws_secret_access_key:
-            # Use credentials from config
-            session_kwargs['aws_access_key_id'] = config.aws_access_key_id
-            session_kwargs['aws_secret_access_key'] = config.aws_secret_access_key
-            session_kwargs['region_name'] = config.aws_region
-        else:
-            # Fall back to default credentials (environment variables, ~/.aws/credentials, etc.)
-            session_kwargs['region_name'] = config.aws_region
-
-        self.s3_client = boto3.client('s3', **session_kwargs)
+        self.s3_client = _s3_client(
+            config.aws_credentials_file,
+            _file_version(config.aws_credentials_file),
+            config.aws_access_key_id,
+            config.aws_secret_access_key,
+            config.aws_region
+        )
         self.bucket_name = config.bucket_name
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_MAX_CONCURRENCY,
+            use_threads=True
+        )
+        # Per-page objects are small single-part PUTs; the concurrency
+        # is across objects rather than within one
+        self.page_transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            max_concurrency=UPLOAD_CONCURRENCY,
+            use_threads=True
+        )
+        self.upload_executor = ThreadPoolExecutor(
+            max_workers=UPLOAD_CONCURRENCY, thread_name_prefix="s3-upload"
+        )
 
-    def _get_s3_key(self, website_id: str, file_type: str = "parquet") -> str:
+    async def aclose(self) -> None:
+        """Shut down the upload thread pool once in-flight uploads finish."""
+        await asyncio.to_thread(self.upload_executor.shutdown)
+
+    def _shard_prefix(self, website_id: str) -> str:
+        """Leading key component that spreads writes across S3 partitions."""
+        if not self.config.s3_hash_prefix:
+            return ""
+        digest = hashlib.blake2b(website_id.encode('utf-8'), digest_size=4).hexdigest()
+        return f"{digest}/"
+
+    def _get_s3_key(
+        self,
+        website_id: str,
+        file_type: str = "parquet",
+        now: Optional[datetime] = None
+    ) -> str:
         """Get S3 key for storing data."""
+        # One clock read, so the date partition and timestamp always agree
+        now = now or datetime.now(timezone.utc)
         if self.config.partition_by_date:
-            date_str = datetime.now(timezone.utc).strftime("%Y_%m_%d")
-            path_prefix = f"data/{date_str}"
+            date_str = now.strftime("%Y_%m_%d")
+            path_prefix = f"{self._shard_prefix(website_id)}data/{date_str}"
         else:
-            path_prefix = "data"
+            path_prefix = f"{self._shard_prefix(website_id)}data"
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"{website_id}_{timestamp}.{file_type}"
 
         return f"{path_prefix}/{filename}"
 
+    def _upload_many(self, uploads: List[Tuple[str, str, str]]) -> None:
+        """Upload (content, key, content_type) triples and wait for all (blocking)."""
+        with create_transfer_manager(self.s3_client, self.page_transfer_config) as manager:
+            futures = [
+                manager.upload(
+                    io.BytesIO(content.encode('utf-8')),
+                    self.bucket_name,
+                    s3_key,
+                    extra_args={'ContentType': content_type}
+                )
+                for content, s3_key, content_type in uploads
+            ]
+            for future in futures:
+                future.result()
+
     async def save_result(self, result: ScrapingResult) -> str:
         """Save complete scraping result to S3."""
         try:
             website_id = result.website_id or "unknown"
             s3_key = self._get_s3_key(website_id)
 
-            # Convert to Polars DataFrame
-            df_data = []
-            for page in result.pages:
-                row = {
-                    "website_id": result.website_id,
-                    "original_url": result.original_url,
-                    "page_url": page.url,
-                    "title": page.title,
-                    "html": page.html,
-                    "text": page.text,
-                    "scraped_at": page.scraped_at,
-                    "load_time": page.load_time,
-                    "status_code": page.status_code,
-                    "error": page.error,
-                    "link_count": len(page.links),
-                    "image_count": len(page.images),
-                    "content_length": len(page.html),
-                    "text_length": len(page.text)
-                }
-
-                # Add metadata as separate columns
-                for key, value in page.metadata.items():
-                    row[f"metadata_{key}"] = value
-
-                df_data.append(row)
-
-            df = pl.DataFrame(df_data)
-
-            # Save to secure temporary file
-            fd, temp_file = tempfile.mkstemp(suffix='.parquet', prefix=f'{website_id}_')
-            try:
-                os.close(fd)  # Close the file descriptor, we'll write via polars
-                df.write_parquet(
-                    temp_file,
-                    compression=self.config.compression
-                )
+            # Serialize in memory; the bytes go straight to the upload
+            buffer = io.BytesIO()
+            write_result_parquet(result, buffer, **_parquet_options(self.config))
+            buffer.seek(0)
 
-                # Upload to S3
-                def _upload():
-                    self.s3_client.upload_file(temp_file, self.bucket_name, s3_key)
+            # Upload to S3 (multipart above S3_MULTIPART_THRESHOLD)
+            def _upload():
+                self.s3_client.upload_fileobj(
+                    buffer, self.bucket_name, s3_key, Config=self.transfer_config
+                )
 
-                await asyncio.get_event_loop().run_in_executor(None, _upload)
+            await asyncio.get_event_loop().run_in_executor(None, _upload)
 
-                logger.info(f"Saved scraping result to s3://{self.bucket_name}/{s3_key}")
-                return f"s3://{self.bucket_name}/{s3_key}"
-            finally:
-                # Always clean up temp file, even on failure
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+            logger.info(f"Saved scraping result to s3://{self.bucket_name}/{s3_key}")
+            return f"s3://{self.bucket_name}/{s3_key}"
 
         except Exception as e:
             logger.error(f"Failed to save result to S3: {e}")
@@ -371,42 +646,36 @@ class S3StorageBackend(StorageBackend):
         try:
             if self.config.partition_by_date:
                 date_str = datetime.now(timezone.utc).strftime("%Y_%m_%d")
-                base_path = f"pages/{website_id}/{date_str}"
+                base_path = f"{self._shard_prefix(website_id)}pages/{website_id}/{date_str}"
             else:
-                base_path = f"pages/{website_id}"
-
-            saved_files = []
-
-            def _upload_content(content: str, s3_key: str, content_type: str):
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=content.encode('utf-8'),
-                    ContentType=content_type
-                )
-
-            # Upload all pages concurrently
-            upload_tasks = []
-            for i, page in enumerate(pages):
-                # HTML file
-                html_key = f"{base_path}/page_{i:03d}.html"
-                upload_tasks.append(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, _upload_content, page.html, html_key, 'text/html'
+                base_path = f"{self._shard_prefix(website_id)}pages/{website_id}"
+
+            if self.config.save_pages_batched:
+                # One object per call: a single PUT instead of two per page
+                archive_key = f"{base_path}/pages.tar.gz"
+
+                def _upload_archive():
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=archive_key,
+                        Body=pages_archive(pages),
+                        ContentType='application/gzip'
                     )
-                )
 
-                # Text file
-                text_key = f"{base_path}/page_{i:03d}.txt"
-                upload_tasks.append(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, _upload_content, page.text, text_key, 'text/plain'
-                    )
-                )
+                await asyncio.get_running_loop().run_in_executor(self.upload_executor, _upload_archive)
+                logger.info(f"Saved {len(pages)} pages to s3://{self.bucket_name}/{archive_key}")
+                return f"s3://{self.bucket_name}/{archive_key}"
 
-                saved_files.extend([html_key, text_key])
+            # Upload all pages through one transfer manager, whose worker
+            # pool keeps UPLOAD_CONCURRENCY puts in flight
+            uploads = []
+            for i, page in enumerate(pages):
+                uploads.append((page.html, f"{base_path}/page_{i:03d}.html", 'text/html'))
+                uploads.append((page.text, f"{base_path}/page_{i:03d}.txt", 'text/plain'))
 
-            await asyncio.gather(*upload_tasks)
+            await asyncio.get_running_loop().run_in_executor(
+                self.upload_executor, self._upload_many, uploads
+            )
 
             logger.info(f"Saved {len(pages)} pages to s3://{self.bucket_name}/{base_path}")
             return f"s3://{self.bucket_name}/{base_path}"
@@ -450,6 +719,11 @@ class ResilientStorageBackend(StorageBackend):
                 self.has_fallen_back = True
             return await self.fallback_backend.save_pages(pages, website_id)
 
+    async def aclose(self) -> None:
+        """Close the primary and fallback backends."""
+        await self.primary_backend.aclose()
+        await self.fallback_backend.aclose()
+
 
 def get_storage_backend(config: StorageConfig) -> StorageBackend:
     """Factory function to get appropriate storage backend.
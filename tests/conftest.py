@@ -0,0 +1,16 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # optional; tests fall back to the stdlib event loop
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async tests on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
@@ -0,0 +1,45 @@
+"""Unit tests for the municipal data models."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.municipal_scraper.data_models import (
+    DiscoveryResult,
+    DocumentType,
+    MeetingDocument,
+    Municipality,
+    validate_many,
+)
+
+MUNICIPALITY = {"name": "Teststadt", "state": "Bayern", "administrative_level": "Stadt"}
+
+
+def test_urls_unchecked_by_default():
+    """Without the validation context URLs are stored as given."""
+    municipality = Municipality(**MUNICIPALITY, ris_url="not a url")
+
+    assert municipality.ris_url == "not a url"
+
+
+def test_urls_checked_with_context():
+    """validate_urls in the validation context checks every URL field."""
+    context = {"validate_urls": True}
+
+    municipality = Municipality.model_validate(
+        {**MUNICIPALITY, "ris_url": "https://ris.example.de"}, context=context
+    )
+    assert municipality.ris_url == "https://ris.example.de/"
+
+    with pytest.raises(ValidationError, match="discovered_urls"):
+        DiscoveryResult.model_validate(
+            {"municipality": MUNICIPALITY, "discovered_urls": ["https://ok.de", "nope"]},
+            context=context,
+        )
+
+    with pytest.raises(ValidationError, match="download_url"):
+        validate_many(MeetingDocument, [{
+            "municipality_name": "Teststadt",
+            "title": "Protokoll",
+            "document_type": DocumentType.PROTOKOLL,
+            "download_url": "ftp:/broken",
+        }], context=context)
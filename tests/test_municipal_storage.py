@@ -0,0 +1,124 @@
+"""Unit tests for the municipal Parquet and JSONL exports."""
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.municipal_scraper.data_models import (
+    DocumentType,
+    Meeting,
+    MeetingDocument,
+    MeetingType,
+    Protocol,
+    RISProvider,
+    ScrapingStatus,
+    from_unix_us,
+)
+from src.municipal_scraper.storage import write_jsonl, write_parquet
+
+UTC_TIMESTAMP = pa.timestamp("us", tz="UTC")
+SCRAPED_AT = datetime(2025, 1, 15, 17, 30, tzinfo=timezone.utc)
+# Local wall-clock time, as parsed from a RIS page
+MEETING_DATE = datetime(2025, 1, 15, 18, 30)
+
+
+def test_write_parquet_meetings(tmp_path):
+    """Enums are stored as their values; timestamps keep their meaning."""
+    meeting = Meeting(
+        municipality_name="Musterstadt",
+        title="Sitzung des Stadtrats",
+        meeting_type=MeetingType.STADTRAT,
+        date=MEETING_DATE,
+        ris_provider=RISProvider.SESSIONNET,
+        scraping_status=ScrapingStatus.SCRAPED,
+        last_scraped=SCRAPED_AT,
+    )
+
+    table = pq.read_table(write_parquet([meeting], tmp_path / "meetings.parquet"))
+
+    row = table.to_pylist()[0]
+    assert row["meeting_type"] == "Stadtrat"
+    assert row["ris_provider"] == "sessionnet"
+    assert row["scraping_status"] == "scraped"
+    # Meeting dates stay naive wall-clock times, not relabelled as UTC
+    assert table.schema.field("date").type == pa.timestamp("us")
+    assert row["date"] == MEETING_DATE
+    assert table.schema.field("last_scraped").type == UTC_TIMESTAMP
+    assert row["last_scraped"] == SCRAPED_AT
+    # UnixMicros ints map onto UTC timestamps
+    assert table.schema.field("created_at").type == UTC_TIMESTAMP
+    assert row["created_at"] == from_unix_us(meeting.created_at)
+
+
+def test_write_parquet_documents(tmp_path):
+    """Document rows keep their enum values and optional columns."""
+    document = MeetingDocument(
+        municipality_name="Musterstadt",
+        title="Niederschrift",
+        document_type=DocumentType.PROTOKOLL,
+        file_size_bytes=2048,
+        download_url="https://ris.example.de/getfile.pdf?id=1",
+        download_status=ScrapingStatus.SCRAPED,
+    )
+
+    table = pq.read_table(write_parquet([document], tmp_path / "documents.parquet"))
+
+    row = table.to_pylist()[0]
+    assert row["document_type"] == "Protokoll"
+    assert row["download_status"] == "scraped"
+    assert row["file_size_bytes"] == 2048
+    assert row["last_downloaded"] is None
+    assert row["updated_at"] == from_unix_us(document.updated_at)
+
+
+def test_write_parquet_protocols(tmp_path):
+    """Sequence fields are written as list columns."""
+    protocols = [
+        Protocol(
+            municipality_name="Musterstadt",
+            title="Protokoll",
+            meeting_date=MEETING_DATE,
+            meeting_type=MeetingType.GEMEINDERAT,
+            attendees=("Müller", "Schmidt"),
+            topics=["Haushalt"],
+            full_text="Niederschrift der Sitzung",
+        ),
+        Protocol(
+            municipality_name="Musterstadt",
+            title="Protokoll ohne Teilnehmer",
+            meeting_date=MEETING_DATE,
+            meeting_type=MeetingType.ANDERE,
+            full_text="",
+        ),
+    ]
+
+    table = pq.read_table(
+        write_parquet(protocols, tmp_path / "protocols.parquet", batch_rows=1)
+    )
+
+    assert table.schema.field("attendees").type == pa.list_(pa.string())
+    assert table.column("attendees").to_pylist() == [["Müller", "Schmidt"], []]
+    assert table.column("topics").to_pylist() == [["Haushalt"], []]
+    assert table.column("meeting_type").to_pylist() == ["Gemeinderat", "Andere"]
+    assert table.column("meeting_date").to_pylist() == [MEETING_DATE, MEETING_DATE]
+
+
+def test_write_jsonl_round_trip(tmp_path):
+    """Each line validates back into an equal model."""
+    meetings = [
+        Meeting(
+            municipality_name="Musterstadt",
+            title=f"Sitzung {i}",
+            meeting_type=MeetingType.STADTRAT,
+            date=MEETING_DATE,
+            last_scraped=SCRAPED_AT,
+        )
+        for i in range(3)
+    ]
+
+    path = write_jsonl(meetings, tmp_path / "meetings.jsonl")
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [Meeting.model_validate_json(line) for line in lines] == meetings
@@ -0,0 +1,233 @@
+"""Unit tests for the municipal protocol scraper's offline helpers."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.scraper.models import ScrapedContent
+from src.municipal_scraper.data_models import (
+    DocumentType,
+    MeetingDocument,
+    MeetingType,
+    Municipality,
+    ScrapingStatus,
+)
+from src.municipal_scraper.protocol_scraper import ProtocolScraper
+
+
+@pytest.fixture
+def protocol_scraper(tmp_path):
+    """Create a protocol scraper with a throwaway download directory."""
+    return ProtocolScraper(scraper=object(), download_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://ris.example.de/anlage_zum_protokoll.pdf", DocumentType.ANLAGE),
+    ("https://ris.example.de/Protokoll_2024.pdf", DocumentType.PROTOKOLL),
+    ("https://ris.example.de/NIEDERSCHRIFT.pdf", DocumentType.PROTOKOLL),
+    ("https://ris.example.de/tagesordnung.docx", DocumentType.TAGESORDNUNG),
+    ("https://ris.example.de/bericht.pdf", DocumentType.ANDERE),
+])
+def test_guess_document_type(protocol_scraper, url, expected):
+    """The most specific keyword appearing first in the URL decides the type."""
+    assert protocol_scraper._guess_document_type(url) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Sitzung des Finanzausschusses", MeetingType.FINANZAUSSCHUSS),
+    ("Öffentliche Sitzung der GEMEINDEVERTRETUNG", MeetingType.GEMEINDEVERTRETUNG),
+    ("Ausschuss für Umwelt", MeetingType.AUSSCHUSS),
+    ("Bürgerversammlung", MeetingType.ANDERE),
+])
+def test_determine_meeting_type(protocol_scraper, text, expected):
+    """Meeting types are matched case-insensitively."""
+    assert protocol_scraper._determine_meeting_type(text) == expected
+
+
+def test_index_links(protocol_scraper):
+    """Links are classified in one pass; document URLs may carry a query."""
+    content = ScrapedContent(
+        url="https://ris.example.de/",
+        html="",
+        text="",
+        links=[
+            "https://ris.example.de/SI010.asp?id=1",
+            "https://ris.example.de/sitzung/42",
+            "https://ris.example.de/getfile.pdf?id=123",
+            "https://ris.example.de/getfile.pdf?id=123",
+            "https://ris.example.de/Protokoll.PDF",
+            "https://ris.example.de/docs/overview",
+        ],
+    )
+    index = protocol_scraper._index_links(content)
+    assert index['regisafe'] == ["https://ris.example.de/SI010.asp?id=1"]
+    assert index['meeting'] == [
+        "https://ris.example.de/sitzung/42",
+        "https://ris.example.de/Protokoll.PDF",
+    ]
+    assert index['document'] == [
+        "https://ris.example.de/getfile.pdf?id=123",
+        "https://ris.example.de/Protokoll.PDF",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_download_document_revalidates_with_etag(protocol_scraper, tmp_path):
+    """A second run sends the stored ETag and keeps the file on 304."""
+    requests = []
+
+    async def handler(request):
+        if request.method == 'GET':
+            requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(body=b"%PDF-1.4", headers={'ETag': '"v1"'})
+
+    app = web.Application()
+    app.router.add_get('/protokoll.pdf', handler)
+    municipality = Municipality(
+        name="Teststadt", state="Bayern", administrative_level="Stadt"
+    )
+
+    async with TestServer(app) as server, protocol_scraper:
+        muni_dir = tmp_path / municipality.name
+        muni_dir.mkdir()
+        for _ in range(2):
+            document = MeetingDocument(
+                municipality_name=municipality.name,
+                title="Protokoll",
+                document_type=DocumentType.PROTOKOLL,
+                file_name="protokoll.pdf",
+                download_url=str(server.make_url('/protokoll.pdf')),
+            )
+            assert await protocol_scraper._download_document(
+                document, municipality, muni_dir=muni_dir
+            )
+            await protocol_scraper._save_validators(muni_dir)
+
+    assert requests == [None, '"v1"']
+    assert document.download_status == ScrapingStatus.SCRAPED
+    assert document.file_size_bytes == len(b"%PDF-1.4")
+    assert (muni_dir / '.etags.json').exists()
+
+
+@pytest.mark.asyncio
+async def test_download_document_keeps_query_documents_apart(protocol_scraper, tmp_path):
+    """Documents sharing a path but not a query string get their own files."""
+    async def handler(request):
+        return web.Response(body=f"%PDF-1.4 {request.query['id']}".encode() * 1000)
+
+    app = web.Application()
+    app.router.add_get('/getfile.pdf', handler)
+    municipality = Municipality(
+        name="Teststadt", state="Bayern", administrative_level="Stadt"
+    )
+
+    async with TestServer(app) as server, protocol_scraper:
+        documents = [
+            MeetingDocument(
+                municipality_name=municipality.name,
+                title=f"Protokoll {i}",
+                document_type=DocumentType.PROTOKOLL,
+                file_name="getfile.pdf",
+                download_url=str(server.make_url(f'/getfile.pdf?id={i}')),
+            )
+            for i in (1, 2)
+        ]
+        results = await asyncio.gather(*(
+            protocol_scraper._download_document(document, municipality, muni_dir=tmp_path)
+            for document in documents
+        ))
+
+    assert results == [True, True]
+    assert documents[0].local_path != documents[1].local_path
+    for i, document in zip((1, 2), documents):
+        with open(document.local_path, 'rb') as f:
+            assert f.read() == f"%PDF-1.4 {i}".encode() * 1000
+    # Temp files were renamed into place
+    assert not list(tmp_path.glob('*.part'))
+
+
+@pytest.mark.asyncio
+async def test_download_document_skips_html_overview(protocol_scraper, tmp_path):
+    """A .pdf link that serves an HTML page is skipped after HEAD."""
+    downloads = []
+
+    async def handler(request):
+        if request.method == 'GET':
+            downloads.append(request.path)
+        return web.Response(text="<html></html>", content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/protokoll.pdf', handler)
+    municipality = Municipality(
+        name="Teststadt", state="Bayern", administrative_level="Stadt"
+    )
+    document = MeetingDocument(
+        municipality_name=municipality.name,
+        title="Protokoll",
+        document_type=DocumentType.PROTOKOLL,
+        file_name="protokoll.pdf",
+        file_format="pdf",
+    )
+
+    async with TestServer(app) as server, protocol_scraper:
+        document.download_url = str(server.make_url('/protokoll.pdf'))
+        assert not await protocol_scraper._download_document(
+            document, municipality, muni_dir=tmp_path
+        )
+
+    assert downloads == []
+    assert document.download_status == ScrapingStatus.SKIPPED
+
+
+@pytest.mark.parametrize("content_type", [
+    "application/x-pdf",
+    "application/force-download",
+    "binary/octet-stream",
+])
+@pytest.mark.asyncio
+async def test_download_document_accepts_loose_pdf_types(
+    protocol_scraper, tmp_path, content_type
+):
+    """PDFs served under a non-standard content type are still downloaded."""
+    async def handler(request):
+        return web.Response(body=b"%PDF-1.4", content_type=content_type)
+
+    app = web.Application()
+    app.router.add_get('/protokoll.pdf', handler)
+    municipality = Municipality(
+        name="Teststadt", state="Bayern", administrative_level="Stadt"
+    )
+    document = MeetingDocument(
+        municipality_name=municipality.name,
+        title="Protokoll",
+        document_type=DocumentType.PROTOKOLL,
+        file_name="protokoll.pdf",
+        file_format="pdf",
+    )
+
+    async with TestServer(app) as server, protocol_scraper:
+        document.download_url = str(server.make_url('/protokoll.pdf'))
+        assert await protocol_scraper._download_document(
+            document, municipality, muni_dir=tmp_path
+        )
+
+    assert document.download_status == ScrapingStatus.SCRAPED
+    assert document.file_size_bytes == len(b"%PDF-1.4")
+
+
+@pytest.mark.asyncio
+async def test_extract_document_text(protocol_scraper, tmp_path):
+    """Text files are read as-is; PDF extraction is not supported yet."""
+    txt = tmp_path / "protokoll.txt"
+    txt.write_text("Niederschrift der Sitzung", encoding="utf-8")
+    pdf = tmp_path / "protokoll.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+
+    assert await protocol_scraper._extract_document_text(str(txt)) == "Niederschrift der Sitzung"
+    assert await protocol_scraper._extract_document_text(str(pdf)) is None
+    # Neither format needs the HTML extraction pool
+    assert protocol_scraper._html_pool is None
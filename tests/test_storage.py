@@ -0,0 +1,143 @@
+"""Unit tests for the scraper's Parquet and archive writers."""
+
+import io
+import json
+import tarfile
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pydantic import ValidationError
+
+from scraper.models import ScrapedContent, ScrapingResult, StorageConfig
+from scraper.storage import (
+    S3StorageBackend,
+    get_storage_backend,
+    pages_archive,
+    write_result_parquet,
+)
+
+
+def _result(*pages):
+    """A scraping result holding the given pages."""
+    return ScrapingResult(
+        website_id="storage_test",
+        original_url="https://example.com/",
+        pages=list(pages),
+    )
+
+
+def test_parquet_without_html_keeps_lengths():
+    """Dropping the html column still records each page's content length."""
+    result = _result(
+        ScrapedContent(url="https://example.com/a", html="<p>Grüße</p>", text="Grüße"),
+        ScrapedContent(url="https://example.com/b", html="<html></html>", text=""),
+    )
+    buffer = io.BytesIO()
+
+    write_result_parquet(result, buffer, store_html=False)
+
+    table = pq.read_table(io.BytesIO(buffer.getvalue()))
+    assert "html" not in table.schema.names
+    assert table.column("text").to_pylist() == ["Grüße", ""]
+    # Character counts, not UTF-8 byte counts
+    assert table.column("content_length").to_pylist() == [12, 13]
+    assert table.column("text_length").to_pylist() == [5, 0]
+
+
+def test_declared_metadata_columns():
+    """Declared keys get typed columns; the rest are kept as JSON."""
+    result = _result(
+        ScrapedContent(
+            url="https://example.com/a", html="", text="",
+            metadata={"author": "Melville", "word_count": 42, "lang": "en"},
+        ),
+        ScrapedContent(url="https://example.com/b", html="", text="", metadata={}),
+    )
+    config = StorageConfig(metadata_columns={"author": "string", "word_count": "int64"})
+    buffer = io.BytesIO()
+
+    write_result_parquet(result, buffer, declared_metadata=config.metadata_columns)
+
+    table = pq.read_table(io.BytesIO(buffer.getvalue()))
+    assert table.schema.field("metadata_author").type == pa.string()
+    assert table.schema.field("metadata_word_count").type == pa.int64()
+    assert "metadata_lang" not in table.schema.names
+    assert table.column("metadata_word_count").to_pylist() == [42, None]
+    extra = table.column("metadata_json").to_pylist()
+    assert json.loads(extra[0]) == {"lang": "en"}
+    assert extra[1] is None
+
+
+def test_unknown_metadata_column_type_rejected():
+    """An unknown Arrow type name fails when the config is built."""
+    with pytest.raises(ValidationError, match="integer"):
+        StorageConfig(metadata_columns={"word_count": "integer"})
+
+
+
+@pytest.mark.parametrize("field", ["row_group_pages", "data_page_size"])
+@pytest.mark.parametrize("value", [0, -1])
+def test_non_positive_parquet_sizes_rejected(field, value):
+    """Row group and data page sizes must be positive."""
+    with pytest.raises(ValidationError, match=field):
+        StorageConfig(**{field: value})
+
+
+def test_pages_archive():
+    """The archive holds a page_NNN.html and page_NNN.txt member per page."""
+    pages = [
+        ScrapedContent(url="https://example.com/a", html="<h1>Grüße</h1>", text="Grüße"),
+        ScrapedContent(url="https://example.com/b", html="<p>b</p>", text="b"),
+    ]
+
+    with tarfile.open(fileobj=io.BytesIO(pages_archive(pages)), mode="r:gz") as archive:
+        assert archive.getnames() == [
+            "page_000.html", "page_000.txt", "page_001.html", "page_001.txt",
+        ]
+        contents = {
+            member.name: archive.extractfile(member).read().decode("utf-8")
+            for member in archive.getmembers()
+        }
+
+    assert contents["page_000.html"] == "<h1>Grüße</h1>"
+    assert contents["page_000.txt"] == "Grüße"
+    assert contents["page_001.html"] == "<p>b</p>"
+    assert contents["page_001.txt"] == "b"
+
+
+@pytest.mark.parametrize("hash_prefix, expected", [
+    (False, "data/2025_01_15/example_site_20250115_120000.parquet"),
+    (True, "58a74ea2/data/2025_01_15/example_site_20250115_120000.parquet"),
+])
+def test_s3_key_layout(hash_prefix, expected):
+    """Keys only start with the website_id hash when s3_hash_prefix is set."""
+    backend = S3StorageBackend(StorageConfig(
+        storage_type="s3",
+        bucket_name="test-bucket",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        s3_hash_prefix=hash_prefix,
+    ))
+    now = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+    assert backend._get_s3_key("example_site", now=now) == expected
+
+
+@pytest.mark.asyncio
+async def test_cloud_backend_aclose_shuts_down_uploads(tmp_path):
+    """Closing the fallback wrapper shuts down the cloud upload threads."""
+    backend = get_storage_backend(StorageConfig(
+        storage_type="s3",
+        output_dir=str(tmp_path),
+        bucket_name="test-bucket",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    ))
+
+    async with backend:
+        pass
+
+    with pytest.raises(RuntimeError):
+        backend.primary_backend.upload_executor.submit(int)
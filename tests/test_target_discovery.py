@@ -0,0 +1,81 @@
+"""Unit tests for RIS target discovery helpers."""
+
+import pytest
+
+from src.scraper.models import ScrapedContent
+
+from src.municipal_scraper.data_models import RISProvider
+from src.municipal_scraper.target_discovery import TargetDiscovery
+
+
+@pytest.fixture
+def discovery():
+    """Create a discovery instance without a live scraper."""
+    return TargetDiscovery(scraper=object())
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Stadt Münster", "muenster"),
+    ("Groß-Gerau Gemeinde", "gross-gerau"),
+    ("Amt Mittelholstein", "mittelholstein"),
+    ("Bad  Tölz (Oberbayern)", "bad-toelz-oberbayern"),
+])
+def test_clean_name_for_url(discovery, name, expected):
+    """Prefixes are stripped, umlauts transliterated and separators collapsed."""
+    assert discovery._clean_name_for_url(name) == expected
+
+
+def test_calculate_ris_score(discovery):
+    """Each distinct keyword counts once, including overlapping ones."""
+    content = ScrapedContent(
+        url="https://ratsinfo.example.de/",
+        html="<h1>Stadtratsinformationssystem</h1>",
+        text="",
+    )
+    # stadtrat and ratsinformationssystem overlap: 2 * 0.2, plus 0.2 for stadtrat
+    assert discovery._calculate_ris_score(content) == pytest.approx(0.6)
+
+    content = ScrapedContent(url="https://example.de/", html="", text="Protokoll")
+    assert discovery._calculate_ris_score(content) == pytest.approx(0.4)
+
+    # Keywords are matched in raw HTML, including character references
+    content = ScrapedContent(
+        url="https://example.de/",
+        html="<a>Aussch&uuml;sse</a> <a>Fraktionen</a> AUSSCHÜSSE",
+        text="",
+    )
+    assert discovery._calculate_ris_score(content) == pytest.approx(0.4)
+
+
+def test_extract_ris_links(discovery):
+    """Links match on URL or anchor text, resolved and de-duplicated."""
+    content = ScrapedContent(
+        url="https://example.de/",
+        html="",
+        text="",
+        links=["/Gemeinderat/", "https://example.de/Gemeinderat/", "/kontakt"],
+    )
+    assert discovery._extract_ris_links(content, "https://example.de/") == [
+        "https://example.de/Gemeinderat/",
+    ]
+
+    content = ScrapedContent(
+        url="https://example.de/",
+        html='<a href="/politik">Ratsinformationssystem</a><a href="/kontakt">Kontakt</a>',
+        text="",
+    )
+    assert discovery._extract_ris_links(content, "https://example.de/") == [
+        "https://example.de/politik",
+    ]
+
+
+@pytest.mark.parametrize("url, html, expected", [
+    ("https://gemeinde.sessionnet.org/", "", RISProvider.SESSIONNET),
+    ("https://example.de/", "Powered by ALLRIS ... regisafe", RISProvider.REGISAFE),
+    ("https://example.de/", "somacos GmbH", RISProvider.SOMACOS),
+    ("https://example.de/", "<p>Rathaus</p>", RISProvider.UNKNOWN),
+])
+def test_detect_provider(discovery, url, html, expected):
+    """URL patterns win over HTML signatures, which follow a fixed precedence."""
+    content = ScrapedContent(url=url, html=html, text="")
+    assert discovery._detect_provider(content) == expected